@@ -7,9 +7,9 @@ the user to select suffixes that should be sorted into subfolders created based
 from __future__ import annotations
 
 import sys
+from collections import defaultdict
 from pathlib import Path
 
-import inquirer
 from polykit import PolyFile, PolyLog
 from polykit.cli import confirm_action, walking_man
 from polykit.core import polykit_setup
@@ -26,14 +26,19 @@ files = PolyFile()
 logger = PolyLog.get_logger(level=env.log_level, simple=True)
 
 
-def get_unique_suffixes(bounces: list[Bounce]) -> list[str]:
-    """Get all unique suffixes from the bounce files."""
-    suffixes = {bounce.suffix for bounce in bounces if bounce.suffix}
-    return sorted(suffixes)
+def group_by_suffix(bounces: list[Bounce]) -> dict[str, list[Bounce]]:
+    """Group the bounce files by suffix in a single pass, leaving out those without one."""
+    by_suffix: defaultdict[str, list[Bounce]] = defaultdict(list)
+    for bounce in bounces:
+        if bounce.suffix:
+            by_suffix[bounce.suffix].append(bounce)
+    return dict(by_suffix)
 
 
 def prompt_user_for_suffixes(suffixes: list[str]) -> list[str]:
     """Prompt the user to select suffixes for folder creation."""
+    import inquirer  # Only needed if there's something to sort, so don't import it otherwise
+
     questions = [
         inquirer.Checkbox(
             "selected_suffixes",
@@ -51,26 +56,30 @@ def prompt_user_for_suffixes(suffixes: list[str]) -> list[str]:
     return answers.get("selected_suffixes", [])
 
 
-def sort_bounces(bounces: list[Bounce], selected_suffixes: list[str]) -> None:
+def sort_bounces(by_suffix: dict[str, list[Bounce]], selected_suffixes: list[str]) -> None:
     """Sort bounce files into folders based on selected suffixes."""
     duplicates: list[Path] = []
 
     for suffix in selected_suffixes:
-        if matching_bounces := [bounce for bounce in bounces if bounce.suffix == suffix]:
+        if matching_bounces := by_suffix.get(suffix):
             destination_folder = Path(suffix)
 
             # Check if folder exists before trying to create it
             if not destination_folder.exists():
                 destination_folder.mkdir()
                 logger.info("\nCreated folder: %s", suffix)
+                existing: set[str] = set()
             else:
                 logger.debug("\nUsing existing folder: %s", suffix)
+                # Read the folder once rather than checking each destination separately, ignoring
+                # case like the (usually case-insensitive) volume itself does
+                existing = {path.name.casefold() for path in destination_folder.iterdir()}
 
             for bounce in matching_bounces:
                 source = bounce.file_path
                 destination = destination_folder / source.name
 
-                if destination.exists():
+                if source.name.casefold() in existing:
                     logger.info(
                         "%s already exists in the %s folder.",
                         color(source.name, "cyan"),
@@ -80,6 +89,7 @@ def sort_bounces(bounces: list[Bounce], selected_suffixes: list[str]) -> None:
                     continue
 
                 if files.move(source, destination, overwrite=False):
+                    existing.add(source.name.casefold())
                     logger.info(
                         "%s -> %s",
                         color(source.name, "white"),
@@ -111,8 +121,8 @@ def handle_duplicates(duplicates: list[Path]) -> None:
             print(color(f"{failed} deletion{'s' if len(failed) != 1 else ''} failed.", "red"))
 
 
-def scan_bounces() -> tuple[list[Bounce], list[str]]:
-    """Scan bounce files and determine common suffixes."""
+def scan_bounces() -> tuple[dict[str, list[Bounce]], list[str]]:
+    """Scan bounce files and group them by suffix."""
     with walking_man("Scanning bounce files...", "cyan"):
         directory = Path.cwd()
 
@@ -120,28 +130,25 @@ def scan_bounces() -> tuple[list[Bounce], list[str]]:
         all_bounces = BounceParser.find_bounces(directory)
         logger.debug("All bounces found: %s", len(all_bounces))
 
-        # Get unique suffixes
-        unique_suffixes = get_unique_suffixes(all_bounces)
+        # Group them by suffix
+        by_suffix = group_by_suffix(all_bounces)
+        unique_suffixes = sorted(by_suffix)
         logger.debug("Unique suffixes found: %s", unique_suffixes)
 
         if not unique_suffixes:
             logger.debug("No suffixes found in bounce list.")
-            return [], []
-
-        # Filter the bounces
-        suffixed_bounces = [bounce for bounce in all_bounces if bounce.suffix in unique_suffixes]
 
-        return suffixed_bounces, unique_suffixes
+        return by_suffix, unique_suffixes
 
 
 def main() -> None:
     """Sort bounce files into folders based on automatically detected suffixes in their names."""
-    bounces, common_suffixes = scan_bounces()
+    by_suffix, common_suffixes = scan_bounces()
 
     if common_suffixes:
         if selected_suffixes := prompt_user_for_suffixes(common_suffixes):
             print("\nSorting bounce files...")
-            sort_bounces(bounces, selected_suffixes)
+            sort_bounces(by_suffix, selected_suffixes)
             print(color("\nBounce files sorted successfully.", "green"))
         else:
             logger.info("No suffixes selected. Exiting the script.")
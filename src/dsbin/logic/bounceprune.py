@@ -25,7 +25,9 @@ script will consolidate down to one bounce per day named by date with no suffix.
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -48,6 +50,13 @@ class BounceActions:
 
     trash: list[Path]
     rename: list[tuple[Path, Path]]
+    bounces: dict[Path, Bounce] = field(default_factory=dict)
+
+    def date_of(self, file_path: Path) -> datetime:
+        """Get the date of an already-parsed bounce without parsing its filename again."""
+        if file_path not in self.bounces:
+            self.bounces[file_path] = BounceParser.get_bounce(file_path)
+        return self.bounces[file_path].date
 
 
 def determine_actions(
@@ -68,7 +77,7 @@ def determine_actions(
     """
     actions = BounceActions(trash=[], rename=[])
 
-    # Group bounces by title and date
+    # Group bounces by title and date, remembering each one by path for later lookups
     by_date: dict[tuple[str, datetime], list[Bounce]] = {}
     for (title, date, _), suffix_groups in bounce_groups.items():
         key = (title, date)
@@ -76,6 +85,7 @@ def determine_actions(
             by_date[key] = []
         for bounces in suffix_groups.values():
             by_date[key].extend(bounces)
+            actions.bounces.update((bounce.file_path, bounce) for bounce in bounces)
 
     # If skip_latest is True, identify and remove the most recent date for each title
     if skip_latest and by_date:
@@ -103,6 +113,15 @@ def determine_actions(
     return actions
 
 
+def format_bounce_date(bounce: Bounce) -> str:
+    """Format a bounce's date as it appears in filenames (e.g. 24.5.1).
+
+    Built from the already-parsed fields rather than with strftime, which has to parse its format
+    string on every call.
+    """
+    return f"{bounce.year:02d}.{bounce.month}.{bounce.day}"
+
+
 def handle_major(by_date: dict[tuple[str, datetime], list[Bounce]], actions: BounceActions) -> None:
     """Keep only one bounce per day per suffix, removing version numbers entirely."""
     # Regroup bounces by title, date, and suffix
@@ -124,7 +143,7 @@ def handle_major(by_date: dict[tuple[str, datetime], list[Bounce]], actions: Bou
 
         # Always check if the file needs renaming to remove version
         current_stem = latest.file_path.stem
-        new_stem = f"{latest.title} {latest.date.strftime('%y.%-m.%-d')}"
+        new_stem = f"{latest.title} {format_bounce_date(latest)}"
         if latest.suffix:
             new_stem = f"{new_stem} {latest.suffix}"
 
@@ -152,7 +171,7 @@ def handle_minor(by_date: dict[tuple[str, datetime], list[Bounce]], actions: Bou
                 # Rename the latest minor version to just the major version
                 if latest.minor_version:
                     new_name = latest.file_path.with_stem(
-                        f"{latest.title} {latest.date.strftime('%y.%-m.%-d')}_{latest.version}"
+                        f"{latest.title} {format_bounce_date(latest)}_{latest.version}"
                     )
                     if latest.suffix:
                         new_name = new_name.with_stem(f"{new_name.stem} {latest.suffix}")
@@ -174,13 +193,13 @@ def prepare_output(actions: BounceActions) -> tuple[list[str], list[str]]:
     # Sort and prepare trash files
     trash_files = []
     if actions.trash:
-        sorted_trash = sorted(actions.trash, key=lambda x: BounceParser.get_bounce(x).date)
+        sorted_trash = sorted(actions.trash, key=actions.date_of)
         trash_files = [f"✖ {file.name}" for file in sorted_trash]
 
     # Sort and prepare rename files
     rename_files = []
     if actions.rename:
-        sorted_rename = sorted(actions.rename, key=lambda x: BounceParser.get_bounce(x[0]).date)
+        sorted_rename = sorted(actions.rename, key=lambda x: actions.date_of(x[0]))
         rename_files = [
             f"{old_path.name} → {new_path.name}" for old_path, new_path in sorted_rename
         ]
@@ -188,6 +207,29 @@ def prepare_output(actions: BounceActions) -> tuple[list[str], list[str]]:
     return trash_files, rename_files
 
 
+def rename_files(renames: list[tuple[Path, Path]], max_workers: int = 8) -> tuple[int, int]:
+    """Rename files in parallel, since each rename is an independent metadata operation.
+
+    Returns:
+        A tuple of (successful, failed) rename counts.
+    """
+    pairs = [(os.fspath(old_path), os.fspath(new_path)) for old_path, new_path in renames]
+
+    def rename(pair: tuple[str, str]) -> bool:
+        try:
+            os.rename(*pair)  # noqa: PTH104
+        except OSError as e:
+            print_color(f"Failed to rename {Path(pair[0]).name}: {e}", "red")
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(rename, pairs))
+
+    successful = sum(results)
+    return successful, len(results) - successful
+
+
 def execute_actions(actions: BounceActions) -> None:
     """Execute a series of actions on a given directory."""
     if not actions.trash and not actions.rename:
@@ -197,10 +239,7 @@ def execute_actions(actions: BounceActions) -> None:
         files = PolyFile()
         successful_deletions, failed_deletions = files.delete(actions.trash)
 
-        renamed_files_count = 0
-        for old_path, new_path in actions.rename:
-            old_path.rename(new_path)
-            renamed_files_count += 1
+        renamed_files_count, failed_renames_count = rename_files(actions.rename)
 
         completion_message_parts = []
         if len(successful_deletions) > 0:
@@ -215,6 +254,10 @@ def execute_actions(actions: BounceActions) -> None:
             completion_message_parts.append(
                 f"{renamed_files_count} file{'s' if renamed_files_count > 1 else ''} renamed"
             )
+        if failed_renames_count > 0:
+            completion_message_parts.append(
+                f"{failed_renames_count} rename{'s' if failed_renames_count > 1 else ''} failed"
+            )
 
         completion_message = ", ".join(completion_message_parts) + "."
         print_color(completion_message, "green")
@@ -192,33 +192,55 @@ class MediaManager:
             show_animation: Whether to show the loading animation. Defaults to False.
         """
         with conditional_walking_man(show_animation):
-            bit_depth_command = (  # First, try to get the bit depth in the usual way
-                f"ffprobe -v error -select_streams a:0 -show_entries stream=bits_per_raw_sample "
-                f'-of default=noprint_wrappers=1:nokey=1 "{input_file}"'
-            )
-            bit_depth = subprocess.getoutput(bit_depth_command)
-            if bit_depth.isdigit():
-                self.logger.debug("Found bit depth %s for %s.", bit_depth, input_file)
-                return int(bit_depth)
-
-            codec_command = (  # If that fails, try to extract the audio codec format
-                f"ffprobe -v error -select_streams a:0 -show_entries stream=codec_name "
-                f'-of default=noprint_wrappers=1:nokey=1 "{input_file}"'
-            )
-            codec = subprocess.getoutput(codec_command)
-            if "pcm_s16" in codec:
-                self.logger.debug("Determined 16-bit depth from codec '%s'.", codec)
-                return 16
-            if "pcm_s24" in codec:
-                self.logger.debug("Determined 24-bit depth from codec '%s'.", codec)
-                return 24
-            if "pcm_s32" in codec:
-                self.logger.debug("Determined 32-bit depth from codec '%s'.", codec)
-                return 32
+            stream = self.probe_audio_stream(input_file)
+
+        # First, try to get the bit depth in the usual way
+        bit_depth = stream.get("bits_per_raw_sample", "")
+        if bit_depth.isdigit():
+            self.logger.debug("Found bit depth %s for %s.", bit_depth, input_file)
+            return int(bit_depth)
+
+        # If that fails, fall back to the audio codec format
+        codec = stream.get("codec_name", "")
+        if "pcm_s16" in codec:
+            self.logger.debug("Determined 16-bit depth from codec '%s'.", codec)
+            return 16
+        if "pcm_s24" in codec:
+            self.logger.debug("Determined 24-bit depth from codec '%s'.", codec)
+            return 24
+        if "pcm_s32" in codec:
+            self.logger.debug("Determined 32-bit depth from codec '%s'.", codec)
+            return 32
 
         self.logger.warning("Bit depth could not be determined. Skipping 24-bit conversion.")
         return 0
 
+    @staticmethod
+    def probe_audio_stream(input_file: Path) -> dict[str, str]:
+        """Get the details of the first audio stream in one ffprobe call.
+
+        Returns the stream's bit depth, codec, sample rate, and duration as reported by ffprobe, or
+        an empty dictionary if the file has no audio stream or couldn't be read.
+        """
+        command = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "a:0",
+            "-show_entries",
+            "stream=bits_per_raw_sample,bits_per_sample,codec_name,sample_rate,duration",
+            "-of",
+            "json",
+            str(input_file),
+        ]
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+        try:
+            streams = json.loads(result.stdout).get("streams") or [{}]
+        except json.JSONDecodeError:
+            return {}
+        return {key: str(value) for key, value in streams[0].items()}
+
     @staticmethod
     def construct_filename(
         input_file: Path,
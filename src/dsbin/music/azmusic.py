@@ -16,21 +16,55 @@ from __future__ import annotations
 import subprocess
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 import pyperclip
+import requests
 from azure.storage.blob import BlobServiceClient
 from halo import Halo
 from polykit import PolyArgs, PolyEnv, PolyLog
 from pydub import AudioSegment
 from termcolor import colored
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from azure.storage.blob import ContainerClient
+
+try:
+    from azure.identity import DefaultAzureCredential
+    from azure.mgmt.cdn import CdnManagementClient
+
+    cdn_sdk_available = True
+except ImportError:
+    cdn_sdk_available = False
+
+
+@lru_cache(maxsize=1)
+def get_container_client(connect_str: str, container_name: str) -> ContainerClient:
+    """Get a container client, reusing the same one (and its connection pool) across uploads."""
+    return BlobServiceClient.from_connection_string(connect_str).get_container_client(
+        container_name
+    )
+
+
+@lru_cache(maxsize=1)
+def get_cdn_client(subscription_id: str) -> CdnManagementClient:
+    """Get a CDN management client, reusing the same credentials across purges."""
+    return CdnManagementClient(DefaultAzureCredential(), subscription_id)
+
 
 class AzureUploader:
     """Class for uploading audio files to Azure Blob Storage."""
 
     CONTAINER_NAME: ClassVar[str] = "music"
+    CDN_RESOURCE_GROUP: ClassVar[str] = "dsfiles"
+    CDN_PROFILE: ClassVar[str] = "dsfiles"
+    CDN_ENDPOINT: ClassVar[str] = "dsfiles"
+    CDN_URL_PREFIX: ClassVar[str] = "https://files.dannystewart.com/music"
+    MAX_BLOCK_SIZE: ClassVar[int] = 8 * 1024 * 1024
     ALLOWED_FOLDERS: ClassVar[list[str]] = [
         "bm",
         "dw",
@@ -62,17 +96,31 @@ class AzureUploader:
             description="Azure connection string",
             secret=True,
         )
+        self.env.add_var(
+            "AZURE_UPLOAD_CONCURRENCY",
+            attr_name="upload_concurrency",
+            description="Number of blocks to upload to Azure in parallel",
+            required=False,
+            default="4",
+            var_type=int,
+        )
+        self.env.add_var(
+            "AZURE_SUBSCRIPTION_ID",
+            attr_name="subscription_id",
+            description="Azure subscription ID for purging the CDN without the az CLI",
+            required=False,
+        )
 
         # Validate that the folder is one of the allowed folders
         self._validate_folder()
 
-        # Initialize the blob service client
-        self.blob_service_client = BlobServiceClient.from_connection_string(self.env.conn)
-        self.container_client = self.blob_service_client.get_container_client("music")
+        # Get the (shared) container client and a client for this blob
+        self.container_client = get_container_client(self.env.conn, self.CONTAINER_NAME)
         self.blob_client = self.container_client.get_blob_client(self.blob_name)
 
         # Get the relative path and input/output formats
         self.relative_path = f"/{self.subfolder}/{self.blob_name}"
+        self.cdn_url = f"{self.CDN_URL_PREFIX}/{self.upload_path}"
         self.input_format = Path(self.input_file).suffix[1:]
         self.output_format = Path(self.blob_name).suffix[1:]
 
@@ -95,36 +143,43 @@ class AzureUploader:
             upload_spinner.fail(f"Failed to upload to Azure: {e}")
             return
 
-        purge_msg = f"Purging CDN for {self.blob_name} (this may take a few minutes)..."
-        purge_spinner = Halo(text=colored(purge_msg, "cyan"), spinner="dots").start()
+        self._purge_and_repopulate_cdn()
+
+        # Delete the temp file
+        Path(temp_output_file).unlink()
+
+        # Copy the final URL to the clipboard
+        self._print_and_copy_url()
+
+    def _purge_and_repopulate_cdn(self) -> None:
+        """Purge the CDN cache, then warm it again with the new blob.
+
+        Repopulating goes through the CDN itself, so it has to wait for the purge to finish or
+        it would just refresh the stale copy that's about to be thrown away.
+        """
+        msg = f"Purging CDN for {self.blob_name} (this may take a few minutes)..."
+        spinner = Halo(text=colored(msg, "cyan"), spinner="dots").start()
 
         # Purge the Azure CDN cache
         try:
             self.purge_cdn_cache()
-            purge_spinner.succeed(colored("CDN cache purged!", "green"))
+            spinner.succeed(colored("CDN cache purged!", "green"))
         except Exception as e:
-            purge_spinner.fail(f"Failed to purge CDN: {e}")
+            spinner.fail(f"Failed to purge CDN: {e}")
 
-        populate_spinner = Halo(text=colored("Repopulating CDN...", "cyan"), spinner="dots").start()
+        spinner.start(colored("Repopulating CDN...", "cyan"))
 
         # Repopulate the Azure CDN
         try:
             self.repopulate_cdn()
-            populate_spinner.succeed(colored("CDN repopulated!", "green"))
+            spinner.succeed(colored("CDN repopulated!", "green"))
         except Exception as e:
-            populate_spinner.fail(f"Failed to repopulate CDN: {e}")
-
-        # Delete the temp file
-        Path(temp_output_file).unlink()
-
-        # Copy the final URL to the clipboard
-        self._print_and_copy_url()
+            spinner.fail(f"Failed to repopulate CDN: {e}")
 
     def _print_and_copy_url(self) -> None:
-        final_url = f"https://files.dannystewart.com/music/{self.upload_path}"
         self.logger.info("✔ All operations complete!")
-        pyperclip.copy(final_url)
-        self.logger.info("\nURL copied to clipboard: %s", final_url)
+        pyperclip.copy(self.cdn_url)
+        self.logger.info("\nURL copied to clipboard: %s", self.cdn_url)
 
     def _validate_folder(self) -> None:
         if self.subfolder not in self.ALLOWED_FOLDERS:
@@ -152,24 +207,48 @@ class AzureUploader:
         Raises:
             RuntimeError: If the upload fails.
         """
-        blob_client = self.container_client.get_blob_client(self.blob_name)
         with Path(temp_output_file).open("rb") as data:
             try:
-                blob_client.upload_blob(
+                self.blob_client.upload_blob(
                     data,
                     overwrite=True,
                     content_settings={"cache_control": "no-cache, no-store, must-revalidate"},
+                    max_concurrency=self.env.upload_concurrency,
+                    max_block_size=self.MAX_BLOCK_SIZE,
                 )
             except Exception as e:
                 msg = f"Error occurred while uploading to Azure: {e}"
                 raise RuntimeError(msg) from e
 
-    def purge_cdn_cache(self) -> None:
+    def purge_cdn_cache(self, content_paths: Sequence[str] | None = None) -> None:
         """Purges the Azure CDN cache for the specified blob.
 
+        Uses the Azure SDK directly if it's installed and a subscription ID is configured, which
+        avoids the startup cost of the az CLI. Otherwise falls back to the CLI.
+
+        Args:
+            content_paths: Paths to purge, all in a single request. Defaults to this blob's path,
+                but callers uploading several files can pass all of them to purge them at once.
+
         Raises:
             RuntimeError: If the purge fails.
         """
+        content_paths = list(content_paths or [self.relative_path])
+
+        if cdn_sdk_available and self.env.subscription_id:
+            try:
+                cdn_client = get_cdn_client(self.env.subscription_id)
+                cdn_client.endpoints.begin_purge_content(
+                    resource_group_name=self.CDN_RESOURCE_GROUP,
+                    profile_name=self.CDN_PROFILE,
+                    endpoint_name=self.CDN_ENDPOINT,
+                    content_file_paths={"content_paths": content_paths},
+                ).result()
+            except Exception as e:
+                msg = f"Failed to purge Azure CDN cache. Error: {e}"
+                raise RuntimeError(msg) from e
+            return
+
         try:
             subprocess.run(
                 [
@@ -178,13 +257,13 @@ class AzureUploader:
                     "endpoint",
                     "purge",
                     "--resource-group",
-                    "dsfiles",
+                    self.CDN_RESOURCE_GROUP,
                     "--name",
-                    "dsfiles",
+                    self.CDN_ENDPOINT,
                     "--profile-name",
-                    "dsfiles",
+                    self.CDN_PROFILE,
                     "--content-paths",
-                    self.relative_path,
+                    *content_paths,
                 ],
                 check=False,
                 capture_output=True,
@@ -196,20 +275,19 @@ class AzureUploader:
     def repopulate_cdn(self) -> None:
         """Repopulates the Azure CDN for the specified blob.
 
+        Requests only the first byte through the CDN, which is enough to make the edge fetch the
+        blob from origin without transferring the whole file to this machine.
+
         Raises:
             RuntimeError: If the repopulate fails.
         """
         try:
-            blob_data = self.container_client.download_blob(self.blob_name)
+            response = requests.get(self.cdn_url, headers={"Range": "bytes=0-0"}, timeout=30)
+            response.raise_for_status()
         except Exception as e:
-            msg = f"Failed to download blob {self.blob_name}. Error: {e!s}"
+            msg = f"Failed to request {self.cdn_url} from CDN. Error: {e!s}"
             raise RuntimeError(msg) from e
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file_path = f"{temp_dir}/temp_{Path(self.blob_name).name}"
-            with Path(temp_file_path).open("wb") as temp_file:
-                temp_file.write(blob_data.readall())
-
 
 def main() -> None:
     """Process and upload to Azure."""
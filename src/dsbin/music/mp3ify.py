@@ -18,6 +18,11 @@ polykit_setup()
 
 allowed_extensions = [".aiff", ".aif", ".wav", ".m4a", ".flac"]
 
+# Files are converted one at a time, so let ffmpeg pick its own thread count for each one. LAME's
+# compression_level is its algorithm quality: 0 is the slowest and best, 9 the fastest and worst.
+FFMPEG_THREAD_ARGS = ["-threads", "0"]
+LAME_FAST_ARGS = ["-compression_level", "7"]
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -28,6 +33,11 @@ def parse_arguments() -> argparse.Namespace:
         default=str(Path.cwd()),
         help="File or directory of files to convert",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="use LAME's faster, lower-quality encoding algorithm",
+    )
     return parser.parse_args()
 
 
@@ -51,7 +61,11 @@ def main() -> None:
         sys.exit(0)
 
     MediaManager().ffmpeg_audio(
-        input_files=files_to_convert, output_format="mp3", audio_bitrate="320k", show_output=True
+        input_files=files_to_convert,
+        output_format="mp3",
+        audio_bitrate="320k",
+        additional_args=[*FFMPEG_THREAD_ARGS, *(LAME_FAST_ARGS if args.fast else [])],
+        show_output=True,
     )
 
 
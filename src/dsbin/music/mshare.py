@@ -9,16 +9,22 @@ bit depth conversion for 24-bit files.
 
 from __future__ import annotations
 
+import asyncio
+import ctypes
+import ctypes.util
+import importlib
+import os
 import re
+import shutil
 import subprocess
 import sys
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import inquirer
 from polykit import PolyArgs, PolyLog
-from polykit.cli import halo_progress, handle_interrupt, walking_man
+from polykit.cli import halo_progress, handle_interrupt
 from polykit.core import polykit_setup
 from polykit.text import color as colored
 
@@ -26,25 +32,94 @@ from dsbin.media import MediaManager
 
 if TYPE_CHECKING:
     import argparse
+    from collections.abc import Coroutine
 
 polykit_setup()
 
 
+def clone_or_copy_file(source: Path, destination: Path) -> None:
+    """Copy a file, using a copy-on-write clone if the filesystem supports it.
+
+    On macOS this uses clonefile(2), which makes an APFS clone without copying any data. On Linux
+    it uses copy_file_range(2), which reflinks on filesystems like XFS and Btrfs. If neither works,
+    it falls back to shutil.copyfile.
+
+    The copy is made under a temporary name next to the destination and then moved into place, so
+    an existing destination is only replaced once the copy is complete.
+
+    Raises:
+        shutil.SameFileError: If the source and destination are the same file.
+    """
+    if destination.exists() and source.samefile(destination):
+        msg = f"{source} and {destination} are the same file"
+        raise shutil.SameFileError(msg)
+
+    temp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        _clone_or_copy_to_new_file(source, temp_path)
+        temp_path.replace(destination)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _clone_or_copy_to_new_file(source: Path, destination: Path) -> None:
+    """Clone or copy a file to a destination that doesn't exist yet."""
+    try:
+        if sys.platform == "darwin":
+            _clonefile(source, destination)
+            return
+        if sys.platform == "linux":
+            _copy_file_range(source, destination)
+            return
+    except OSError:
+        # Clear out anything a partial attempt left behind before copying the regular way
+        destination.unlink(missing_ok=True)
+
+    shutil.copyfile(source, destination)
+
+
+def _clonefile(source: Path, destination: Path) -> None:
+    """Clone a file with macOS's clonefile(2).
+
+    Raises:
+        OSError: If the clone fails, such as when the filesystem isn't APFS.
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+    if libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), str(source))
+
+
+def _copy_file_range(source: Path, destination: Path) -> None:
+    """Copy a file in the kernel with copy_file_range(2), reflinking where supported.
+
+    Raises:
+        OSError: If copy_file_range isn't supported for these files.
+    """
+    with source.open("rb") as src, destination.open("wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+
 @dataclass
 class ConversionSettings:
     """Settings for a specific conversion operation.
 
     Args:
         filename: The output filename.
-        command: The ffmpeg command to execute.
-        message: The message to show during conversion.
-        completed_message: The message to show after successful conversion.
+        output_args: The ffmpeg output options for this file, or None to copy the input as-is.
+        completion_message: The message to show after successful conversion.
         available_bit_depths: List of acceptable input bit depths.
     """
 
     filename: Path
-    command: str
-    message: str
+    output_args: list[str] | None
     completion_message: str
     available_bit_depths: list[int] = field(default_factory=lambda: [16, 24])
 
@@ -53,50 +128,102 @@ class MusicShare:
     """A class for sharing music bounces in a variety of formats."""
 
     OUTPUT_PATH: ClassVar[Path] = Path.home() / "Downloads"
-
-    def __init__(self, input_file: Path, bit_depth: int, web: bool = False):
+    CLEAN_NAME_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"( [0-9]+([._][0-9]+){2,3}([._][0-9]+)?[a-z]{0,2}$)|(\s*\(No [^)]*\))"
+    )
+    WEB_SAFE_TABLE: ClassVar[dict[int, str | None]] = str.maketrans({" ": "-", "'": None})
+    FORMAT_OPTIONS: ClassVar[dict[str, str]] = {
+        "wav": "Copy original as WAV",
+        "wav24": "Convert to 24-bit WAV",
+        "wav16": "Convert to 16-bit WAV",
+        "flac16": "Convert to 16-bit FLAC",
+        "flac24": "Convert to 24-bit FLAC",
+        "mp3": "Convert to MP3",
+    }
+
+    def __init__(
+        self,
+        input_file: Path,
+        bit_depth: int,
+        web: bool = False,
+        formats: list[str] | None = None,
+    ):
         self.logger = PolyLog.get_logger(simple=True)
         self.input_file = input_file
         self.bit_depth = bit_depth
         self.web = web
+        self.formats = formats
 
     def perform_conversions(self) -> None:
-        """Perform the conversions selected by the user based on conversion options."""
+        """Perform the conversions selected by the user based on conversion options.
+
+        Overwrite decisions are all made up front so nothing interrupts the work afterward. Copies
+        run concurrently with a single ffmpeg process that writes every remaining format, so the
+        input only gets decoded once.
+        """
         answers = self.get_user_format_selections()
         conversion_options = self.get_conversion_settings(answers["options"])
 
+        selected: list[ConversionSettings] = []
         for option, settings in conversion_options.items():
-            if option in answers["options"]:
-                output_file = self.OUTPUT_PATH / settings.filename
-                if output_file.is_file():
-                    self.logger.warning("File %s already exists.", output_file)
-                    action = inquirer.list_input(
-                        "Choose an action",
-                        choices=[
-                            "Overwrite",
-                            "Provide a new name",
-                            "Cancel",
-                        ],
-                    )
-                    if action == "Cancel":
-                        self.logger.warning("Conversion canceled by user.")
-                        continue
-                    if action == "Provide a new name":
-                        custom_filename = input("Enter the new filename: ")
-                        settings.filename = Path(custom_filename)
-
-                with halo_progress(
-                    str(settings.filename),
-                    start_message=settings.message,
-                    end_message=settings.completion_message,
-                    fail_message="Failed",
-                ) as spinner:
-                    success, message = self.convert_file(settings)
-                    if not success:
-                        spinner.fail(message)
+            if option not in answers["options"]:
+                continue
+
+            if self.bit_depth not in settings.available_bit_depths:
+                self.logger.error(
+                    "%s requires %s bit depth but the input is %s bit.",
+                    option,
+                    settings.available_bit_depths,
+                    self.bit_depth,
+                )
+                continue
+
+            if self.confirm_output_file(settings):
+                selected.append(settings)
+
+        # Copies are I/O-bound and conversions are CPU-bound, so run them side by side
+        jobs: list[tuple[list[ConversionSettings], Coroutine[Any, Any, None]]] = [
+            ([settings], self.copy_file(settings))
+            for settings in selected
+            if settings.output_args is None
+        ]
+        if conversions := [s for s in selected if s.output_args is not None]:
+            jobs.append((conversions, self.convert_files(conversions)))
+
+        if jobs:
+            self.run_jobs(jobs)
 
         self.logger.info("All conversions complete!")
 
+    def confirm_output_file(self, settings: ConversionSettings) -> bool:
+        """Check whether the output file exists and ask what to do if so.
+
+        Returns:
+            False if the user canceled this conversion, True otherwise.
+        """
+        output_file = self.OUTPUT_PATH / settings.filename
+        if not output_file.is_file():
+            return True
+
+        import inquirer  # Only needed for prompts, so don't pay for the import otherwise
+
+        self.logger.warning("File %s already exists.", output_file)
+        action = inquirer.list_input(
+            "Choose an action",
+            choices=[
+                "Overwrite",
+                "Provide a new name",
+                "Cancel",
+            ],
+        )
+        if action == "Cancel":
+            self.logger.warning("Conversion canceled by user.")
+            return False
+        if action == "Provide a new name":
+            custom_filename = input("Enter the new filename: ")
+            settings.filename = Path(custom_filename)
+        return True
+
     def get_available_options(self) -> list[str]:
         """Return the available conversion options based on the bit depth."""
         input_ext = self.input_file.suffix.lower()
@@ -120,7 +247,42 @@ class MusicShare:
         return available_options
 
     def get_user_format_selections(self) -> dict[str, list[str]]:
-        """Prompt the user for conversion options from an inquirer menu."""
+        """Prompt the user for conversion options from an inquirer menu.
+
+        If formats were given on the command line, those are used instead and there's no prompt.
+        """
+        if self.formats is not None:
+            answers = {"options": self.get_formats_from_args(self.formats)}
+        else:
+            answers = self.prompt_for_formats()
+
+        # MP3 shame
+        if "Convert to MP3" in answers["options"]:
+            print(colored("MP3 is bad and you should feel bad.\n", "cyan"))
+
+        return answers
+
+    def get_formats_from_args(self, formats: list[str]) -> list[str]:
+        """Convert format names from the command line into conversion options."""
+        available_options = self.get_available_options()
+        options = []
+        for format_name in formats:
+            option = self.FORMAT_OPTIONS.get(format_name)
+            if option not in available_options:
+                available = [k for k, v in self.FORMAT_OPTIONS.items() if v in available_options]
+                self.logger.error(
+                    "Format '%s' is not available for this file. Choose from: %s",
+                    format_name,
+                    ", ".join(available),
+                )
+                sys.exit(1)
+            options.append(option)
+        return options
+
+    def prompt_for_formats(self) -> dict[str, list[str]]:
+        """Show the interactive menu of conversion options."""
+        import inquirer  # Only needed for prompts, so don't pay for the import otherwise
+
         questions = [
             inquirer.Checkbox(
                 "options",
@@ -133,10 +295,6 @@ class MusicShare:
         if answers is None:
             sys.exit(1)
 
-        # MP3 shame
-        if "Convert to MP3" in answers["options"]:
-            print(colored("MP3 is bad and you should feel bad.\n", "cyan"))
-
         return answers
 
     def get_conversion_settings(self, settings: list[str]) -> dict[str, ConversionSettings]:
@@ -174,29 +332,76 @@ class MusicShare:
 
         return conversion_settings
 
-    def convert_file(self, settings: ConversionSettings) -> tuple[bool, str]:
-        """Perform an individual file conversion. Returns success status and message."""
-        if self.bit_depth not in settings.available_bit_depths:
-            return (
-                False,
-                f"Requires {settings.available_bit_depths} bit depth but the input is {self.bit_depth} bit.",
-            )
+    def run_jobs(
+        self, jobs: list[tuple[list[ConversionSettings], Coroutine[Any, Any, None]]]
+    ) -> None:
+        """Run copy and conversion jobs concurrently, then report the result for each output."""
+        with halo_progress(
+            self.input_file.name,
+            start_message="Exporting",
+            end_message="Exported",
+            fail_message="Failed to export",
+        ) as spinner:
+            results = asyncio.run(self._gather_jobs([job for _, job in jobs]))
+            if any(isinstance(result, BaseException) for result in results):
+                spinner.fail()
+
+        for (outputs, _), result in zip(jobs, results, strict=True):
+            for settings in outputs:
+                if isinstance(result, BaseException):
+                    print(colored(f"Failed to create {settings.filename.name}: {result}", "red"))
+                else:
+                    print(
+                        colored(f"{settings.completion_message} {settings.filename.name}", "green")
+                    )
+
+    @staticmethod
+    async def _gather_jobs(jobs: list[Coroutine[Any, Any, None]]) -> list[BaseException | None]:
+        """Await all jobs, at most one per CPU at a time, collecting exceptions as results."""
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
 
+        async def run(job: Coroutine[Any, Any, None]) -> None:
+            async with semaphore:
+                await job
+
+        return await asyncio.gather(*(run(job) for job in jobs), return_exceptions=True)
+
+    async def convert_files(self, conversions: list[ConversionSettings]) -> None:
+        """Write all the given conversions with one multi-output ffmpeg invocation.
+
+        Raises:
+            RuntimeError: If ffmpeg fails.
+        """
+        command = ["ffmpeg", "-i", str(self.input_file), "-y"]
+        for settings in conversions:
+            # Only the first audio stream, so cover art never gets re-encoded along with it
+            command.extend(["-map", "0:a:0", "-threads", "0", *(settings.output_args or [])])
+            command.append(str(self.OUTPUT_PATH / settings.filename))
+
+        await self._run_process(command)
+
+    async def copy_file(self, settings: ConversionSettings) -> None:
+        """Copy the input file as-is to the output path.
+
+        Clones the file where the filesystem supports it (so no data is actually copied), and
+        otherwise falls back to a regular copy.
+        """
         destination_path = self.OUTPUT_PATH / settings.filename
-        command = settings.command.format(
-            input_file=self.input_file, destination_path=destination_path
-        )
+        await asyncio.to_thread(clone_or_copy_file, self.input_file, destination_path)
 
-        try:
-            subprocess.check_call(
-                command,
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            return True, ""
-        except subprocess.CalledProcessError as e:
-            return False, str(e)
+    @staticmethod
+    async def _run_process(command: list[str]) -> None:
+        """Run a command without blocking the event loop.
+
+        Raises:
+            RuntimeError: If the command exits with a nonzero status.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        if await process.wait() != 0:
+            msg = f"{command[0]} exited with status {process.returncode}"
+            raise RuntimeError(msg)
 
     def get_filenames(self, base_name: Path, add_wav: bool, add_flac: bool) -> dict[str, Path]:
         """Generate filenames for the output files."""
@@ -211,27 +416,18 @@ class MusicShare:
     def clean_name(self, web: bool) -> Path:
         """Generate formatted names for the output files. Removes versions and parentheticals."""
         filename_no_ext = self.input_file.stem
-        clean_name_pattern = re.compile(
-            r"( [0-9]+([._][0-9]+){2,3}([._][0-9]+)?[a-z]{0,2}$)|(\s*\(No [^)]*\))"
-        )
-        clean_name = clean_name_pattern.sub("", filename_no_ext)
+        clean_name = self.CLEAN_NAME_PATTERN.sub("", filename_no_ext)
 
         if web:
-            clean_name = clean_name.replace(" ", "-").replace("'", "")
+            clean_name = clean_name.translate(self.WEB_SAFE_TABLE)
 
         return Path(clean_name)
 
     def _get_wav_settings(self, filename: Path, is_wav: bool) -> ConversionSettings:
         """Create settings for original WAV conversion."""
-        command = (
-            f'cp "{self.input_file}" "{filename}"'
-            if is_wav
-            else f'ffmpeg -i "{self.input_file}" -y -acodec pcm_s{self.bit_depth}le "{filename}"'
-        )
         return ConversionSettings(
             filename=filename,
-            command=command,
-            message="Copying" if is_wav else "Converting to WAV",
+            output_args=None if is_wav else ["-acodec", f"pcm_s{self.bit_depth}le"],
             completion_message="Copied:" if is_wav else "Converted to WAV:",
         )
 
@@ -239,8 +435,7 @@ class MusicShare:
         """Create settings for 16-bit WAV conversion."""
         return ConversionSettings(
             filename=filename,
-            command=f'ffmpeg -i "{self.input_file}" -y -acodec pcm_s16le "{filename}"',
-            message="Converting to 16-bit WAV",
+            output_args=["-acodec", "pcm_s16le"],
             completion_message="Converted to 16-bit WAV:",
             available_bit_depths=[16],
         )
@@ -249,8 +444,7 @@ class MusicShare:
         """Create settings for 24-bit WAV conversion."""
         return ConversionSettings(
             filename=filename,
-            command=f'ffmpeg -i "{self.input_file}" -y -acodec pcm_s24le "{filename}"',
-            message="Converting to 24-bit WAV",
+            output_args=["-acodec", "pcm_s24le"],
             completion_message="Converted to 24-bit WAV:",
             available_bit_depths=[24],
         )
@@ -259,8 +453,7 @@ class MusicShare:
         """Create settings for 16-bit FLAC conversion."""
         return ConversionSettings(
             filename=filename,
-            command=f'ffmpeg -i "{self.input_file}" -y -acodec flac -sample_fmt s16 "{filename}"',
-            message="Converting to 16-bit FLAC",
+            output_args=["-acodec", "flac", "-compression_level", "5", "-sample_fmt", "s16"],
             completion_message="Converted to 16-bit FLAC:",
         )
 
@@ -268,8 +461,16 @@ class MusicShare:
         """Create settings for 24-bit FLAC conversion."""
         return ConversionSettings(
             filename=filename,
-            command=f'ffmpeg -i "{self.input_file}" -y -acodec flac -sample_fmt s32 -bits_per_raw_sample 24 "{filename}"',
-            message="Converting to 24-bit FLAC",
+            output_args=[
+                "-acodec",
+                "flac",
+                "-compression_level",
+                "5",
+                "-sample_fmt",
+                "s32",
+                "-bits_per_raw_sample",
+                "24",
+            ],
             completion_message="Converted to 24-bit FLAC:",
         )
 
@@ -277,8 +478,7 @@ class MusicShare:
         """Create settings for MP3 conversion."""
         return ConversionSettings(
             filename=filename,
-            command=f'ffmpeg -i "{self.input_file}" -y -b:a 320k "{filename}"',
-            message="Converting to MP3",
+            output_args=["-b:a", "320k"],
             completion_message="Converted to MP3:",
         )
 
@@ -295,9 +495,34 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "-w", "--web", action="store_true", help="use web-safe filename (no spaces)"
     )
+    parser.add_argument(
+        "-f",
+        "--formats",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        help="comma-separated formats to create without prompting (e.g. wav16,flac24,mp3). "
+        f"Options: {', '.join(MusicShare.FORMAT_OPTIONS)}",
+    )
     return parser.parse_args()
 
 
+async def find_bit_depth(input_file: Path, interactive: bool) -> int:
+    """Determine the bit depth so we know what options to show.
+
+    The menu can't be shown until the bit depth is known, since it decides which options are
+    offered, but if we're going to prompt we can load inquirer while ffprobe runs.
+    """
+    probe = asyncio.to_thread(
+        MediaManager().find_bit_depth, input_file, show_animation=sys.stdout.isatty()
+    )
+    if not interactive:
+        return await probe
+
+    _, bit_depth = await asyncio.gather(
+        asyncio.to_thread(importlib.import_module, "inquirer"), probe
+    )
+    return bit_depth
+
+
 @handle_interrupt()
 def main() -> None:
     """Convert to desired formats."""
@@ -308,10 +533,9 @@ def main() -> None:
         print(colored(f"The file {input_file} does not exist. Aborting.", "red"))
         sys.exit(1)
 
-    with walking_man():  # Determine the bit depth so we know what options to show
-        bit_depth = MediaManager().find_bit_depth(input_file)
+    bit_depth = asyncio.run(find_bit_depth(input_file, interactive=args.formats is None))
 
-    mshare = MusicShare(input_file, bit_depth, args.web)
+    mshare = MusicShare(input_file, bit_depth, args.web, args.formats)
     mshare.perform_conversions()
 
 
@@ -10,14 +10,61 @@ can get rid of the MP3 to save space (and people's ears).
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from polykit import PolyFile
 from polykit.core import polykit_setup
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 polykit_setup()
 
 
+def scan_dir(directory: Path) -> tuple[list[Path], list[str]]:
+    """List a directory's subdirectories and file names in a single pass.
+
+    Returns:
+        A tuple of (subdirectory paths, file names).
+    """
+    subdirs, names = [], []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(Path(entry.path))
+            else:
+                names.append(entry.name)
+    return subdirs, names
+
+
+def walk_parallel(directory: Path, max_workers: int = 16) -> Iterator[tuple[Path, list[str]]]:
+    """Walk a directory tree, scanning several directories at once.
+
+    Listing a directory is mostly waiting on the filesystem (especially on network drives), so
+    each one is scanned in a worker thread and its subdirectories are queued as soon as it's done.
+    Directories that can't be read are skipped, like os.walk does.
+
+    Yields:
+        Each directory in the tree along with the names of the files in it, in no set order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan_dir, directory): directory}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    subdirs, names = future.result()
+                except OSError:
+                    continue
+                for subdir in subdirs:
+                    pending[executor.submit(scan_dir, subdir)] = subdir
+                yield path, names
+
+
 def delete_mp3(directory: Path, dry_run: bool = False) -> None:
     """Removes MP3 files if there is an AIFF or WAV file with the same name.
 
@@ -25,20 +72,21 @@ def delete_mp3(directory: Path, dry_run: bool = False) -> None:
         directory: The directory to search for MP3 files.
         dry_run: If True, will list the files that would be deleted without actually deleting them.
     """
-    files = PolyFile()
-    mp3_files = files.list(directory, extensions="mp3", recursive=True)
-
+    # Every name in each directory is already in hand from the walk, so check for the originals
+    # there instead of asking the filesystem about each one. Names are compared lowercased, since
+    # the volumes this runs on usually ignore case.
     files_to_delete = []
-    for mp3_file in mp3_files:
-        mp3_path = Path(mp3_file)
-        base_path = mp3_path.with_suffix("")
-        aif_file = base_path.with_suffix(".aif")
-        wav_file = base_path.with_suffix(".wav")
-
-        if aif_file.exists() or wav_file.exists():
-            files_to_delete.append(mp3_file)
-
-    files.delete(files_to_delete, dry_run=dry_run)
+    for path, names in walk_parallel(directory):
+        lower_names = {name.lower() for name in names}
+        for name in names:
+            if not name.lower().endswith(".mp3"):
+                continue
+            stem = name[:-4].lower()
+            if f"{stem}.aif" in lower_names or f"{stem}.wav" in lower_names:
+                files_to_delete.append(path / name)
+
+    files_to_delete.sort()
+    PolyFile().delete(files_to_delete, dry_run=dry_run)
 
 
 def main() -> None:
@@ -1,69 +1,206 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import struct
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-import inquirer
-from mutagen import File as MutagenFile  # type: ignore
-from natsort import natsorted
-from polykit import TZ, PolyFile
+from natsort import natsort_keygen
+from polykit import TZ
+from polykit.paths import PolyPath
 
 if TYPE_CHECKING:
     from logging import Logger
 
 
-class BounceFileManager:
-    """Manages selecting files and obtaining metadata."""
+# Natural sort key ("Song 2" before "Song 10"), built once rather than on every listing
+NATURAL_SORT_KEY = natsort_keygen()
 
-    def __init__(self, logger: Logger):
-        self.logger: Logger = logger
-        self.thread_pool = ThreadPoolExecutor()  # for running sync functions
 
-    async def get_audio_files_in_current_dir(self) -> list[str]:
-        """Get a list of audio files in the current directory and returns a sorted list."""
+def read_wav_duration(file_path: Path) -> float | None:
+    """Read the duration of a WAV file in seconds by walking its RIFF chunks.
 
-        def list_files() -> list[str]:
-            extensions = ["wav", "aiff", "mp3", "m4a", "flac"]
-            audio_files = [
-                str(f)
-                for ext in extensions
-                for f in Path().iterdir()
-                if f.suffix.lower() == f".{ext}" and f.is_file()
-            ]
-            return natsorted(audio_files)
+    Returns:
+        The duration, or None if the file isn't a WAV file this can make sense of.
+    """
+    with file_path.open("rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            return None
+
+        byte_rate = 0
+        while len(chunk_header := f.read(8)) == 8:
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            padded_size = chunk_size + chunk_size % 2  # Chunks are word-aligned
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(padded_size)
+                if len(fmt) < 12:
+                    return None
+                (byte_rate,) = struct.unpack_from("<I", fmt, 8)
+            elif chunk_id == b"data":
+                return chunk_size / byte_rate if byte_rate else None
+            else:
+                f.seek(padded_size, os.SEEK_CUR)
+
+    return None
 
-        return await asyncio.get_event_loop().run_in_executor(self.thread_pool, list_files)
 
-    async def get_audio_duration(self, file_path: str) -> int:
-        """Get the duration of the audio file in seconds."""
+@dataclass
+class FileMeta:
+    """Everything about a file needed to post it, gathered from a single stat call.
 
-        def read_duration() -> int:
-            audio = MutagenFile(file_path)
-            return int(audio.info.length) if audio.info.length else 0
+    Args:
+        duration: The duration of the audio in seconds.
+        timestamp: The formatted creation timestamp of the file.
+        size: The size of the file in bytes.
+    """
 
-        return await asyncio.get_event_loop().run_in_executor(self.thread_pool, read_duration)
+    duration: int
+    timestamp: str
+    size: int
 
-    async def get_file_creation_time(self, file_path: str) -> str:
-        """Get the formatted creation timestamp for the file."""
 
-        def get_timestamp() -> str:
-            ctime, _ = PolyFile.get_timestamps(Path(file_path))
-            creation_date = datetime.strptime(ctime, "%m/%d/%Y %H:%M:%S").replace(tzinfo=TZ)
-            return creation_date.strftime("%a %b %d at %-I:%M:%S %p").replace(" 0", " ")
+class BounceFileManager:
+    """Manages selecting files and obtaining metadata."""
+
+    # Most durations to keep cached, dropping the ones least recently probed beyond that
+    MAX_CACHED_DURATIONS: ClassVar[int] = 1000
 
-        return await asyncio.get_event_loop().run_in_executor(self.thread_pool, get_timestamp)
+    def __init__(self, logger: Logger):
+        self.logger: Logger = logger
+
+        # Durations of files we've already seen, keyed by path and checked against mtime and size
+        self.duration_cache_file = PolyPath("pybounce").from_cache("audio_durations.json")
+        self.duration_cache: dict[str, list[int]] = self._load_duration_cache()
+        self.duration_cache_changed: bool = False
+
+    def _load_duration_cache(self) -> dict[str, list[int]]:
+        """Load cached durations, starting fresh if the cache is missing or unreadable."""
+        try:
+            return json.loads(self.duration_cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def save_duration_cache(self) -> None:
+        """Write the duration cache back to disk if anything new was probed.
+
+        Meant to be called once after a batch of files rather than after each one. Entries for
+        files that no longer exist are dropped, as are the oldest ones beyond the size limit.
+        Failing to save just means probing again later.
+        """
+        if not self.duration_cache_changed:
+            return
+
+        live_entries = [
+            (path, entry) for path, entry in self.duration_cache.items() if Path(path).exists()
+        ]
+        self.duration_cache = dict(live_entries[-self.MAX_CACHED_DURATIONS :])
+        self.duration_cache_changed = False
+
+        try:
+            self.duration_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.duration_cache_file.write_text(json.dumps(self.duration_cache))
+        except OSError as e:
+            self.logger.debug("Could not save duration cache: %s", e)
+
+    def get_audio_files_in_current_dir(self) -> list[str]:
+        """Get a list of audio files in the current directory and returns a sorted list.
+
+        This is a single directory read, which is quicker to just do than to hand off to a thread.
+        """
+        extensions = (".wav", ".aiff", ".mp3", ".m4a", ".flac")
+        with os.scandir() as entries:  # One pass, with file types from the directory entries
+            audio_files = [
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(extensions) and entry.is_file()
+            ]
+        return sorted(audio_files, key=NATURAL_SORT_KEY)
+
+    async def get_metadata(self, file_path: str) -> FileMeta:
+        """Get the duration, creation timestamp, and size of a file, statting it only once."""
+        stat = Path(file_path).stat()
+        return FileMeta(
+            duration=await self.get_audio_duration(file_path, stat),
+            timestamp=self.format_creation_time(stat),
+            size=stat.st_size,
+        )
+
+    async def get_audio_duration(self, file_path: str, stat: os.stat_result | None = None) -> int:
+        """Get the duration of the audio file in seconds.
+
+        Durations are cached by path, modification time, and size, so a file that's uploaded again
+        unchanged doesn't need to be read at all. Pass `stat` if the file was already stat'd.
+        """
+        stat = stat or Path(file_path).stat()
+        cache_key = str(Path(file_path).resolve())
+        match self.duration_cache.get(cache_key):
+            case [stat.st_mtime_ns, stat.st_size, cached_duration]:
+                return cached_duration
+
+        duration = await self._read_audio_duration(file_path)
+        if duration:
+            # Re-insert so the dict stays ordered from least to most recently probed
+            self.duration_cache.pop(cache_key, None)
+            self.duration_cache[cache_key] = [stat.st_mtime_ns, stat.st_size, duration]
+            self.duration_cache_changed = True
+        return duration
+
+    async def _read_audio_duration(self, file_path: str) -> int:
+        """Read the duration of the audio file in seconds.
+
+        WAV durations come straight from the RIFF header without starting any process. Everything
+        else goes to ffprobe, which only reads the container header instead of parsing the file.
+        """
+        if file_path.lower().endswith(".wav"):
+            duration = await asyncio.to_thread(read_wav_duration, Path(file_path))
+            if duration is not None:
+                return int(duration)
+
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            file_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        try:
+            return int(float(stdout))
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def format_creation_time(stat: os.stat_result) -> str:
+        """Format the creation timestamp from a file's stat result."""
+        created = getattr(stat, "st_birthtime", stat.st_mtime)  # Birth time is macOS-only
+        creation_date = datetime.fromtimestamp(created, tz=TZ)
+        # Use the day as a number so it isn't zero-padded, rather than stripping zeroes afterward
+        return (
+            f"{creation_date:%a %b} {creation_date.day} at {creation_date.hour % 12 or 12}:"
+            f"{creation_date:%M:%S %p}"
+        )
 
     async def select_interactively(self) -> list[str]:
         """Prompt user to select files interactively."""
-        audio_files = await self.get_audio_files_in_current_dir()
+        audio_files = self.get_audio_files_in_current_dir()
         if not audio_files:
             self.logger.warning("No audio files found in the current directory.")
             return []
 
         def prompt_user() -> list[str]:
+            import inquirer  # Only needed when no files were given, so don't import it otherwise
+
             try:
                 questions = [
                     inquirer.Checkbox(
@@ -79,4 +216,4 @@ class BounceFileManager:
                 self.logger.error("Upload canceled by user.")
                 return []
 
-        return await asyncio.get_event_loop().run_in_executor(self.thread_pool, prompt_user)
+        return await asyncio.to_thread(prompt_user)
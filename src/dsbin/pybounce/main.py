@@ -9,25 +9,44 @@ from __future__ import annotations
 import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from polykit import PolyLog
 from polykit.cli import async_with_handle_interrupt
-from polykit.core import polykit_setup
+from polykit.core import async_retry_on_exception, polykit_setup
 from polykit.env import PolyEnv
 from polykit.files import PolyFile
 from polykit.paths import PolyPath
 from telethon import TelegramClient
-from telethon.tl.types import Channel, Chat, DocumentAttributeAudio
+from telethon.tl.types import (
+    Channel,
+    Chat,
+    DocumentAttributeAudio,
+    InputPeerChannel,
+    InputPeerChat,
+)
+from telethon.utils import get_peer_id
 from tqdm.asyncio import tqdm as async_tqdm
 
 from dsbin.pybounce.bounce_files import BounceFileManager
 from dsbin.pybounce.sqlite_manager import SQLiteManager
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from logging import Logger
 
+    from telethon.tl.types import InputFile
+
+    from dsbin.pybounce.bounce_files import FileMeta
+
+    # A channel resolved from the session cache (input peer) or from Telegram (full entity)
+    type ChannelEntity = Channel | Chat | InputPeerChannel | InputPeerChat
+
+    # A file uploaded to Telegram but not yet posted, along with its metadata
+    type PreparedUpload = tuple[InputFile, FileMeta]
+
 polykit_setup()
 
 POLYPLAYER_DIR = Path(
@@ -51,6 +70,17 @@ def _copy_to_polyplayer(file_path: Path, logger: Logger) -> None:
 class TelegramUploader:
     """Manages the Telegram client and uploads files to a channel."""
 
+    # Largest part size Telegram accepts, which means the fewest round trips per file
+    UPLOAD_PART_SIZE_KB: ClassVar[int] = 512
+
+    # Files to upload at once by default, and how to retry when the connection drops
+    DEFAULT_CONCURRENCY: ClassVar[int] = 4
+    UPLOAD_RETRY_TRIES: ClassVar[int] = 3
+    UPLOAD_RETRY_DELAY: ClassVar[int] = 5
+
+    # Minimum seconds between progress bar updates, so redrawing doesn't slow down the upload
+    PROGRESS_INTERVAL: ClassVar[float] = 0.05
+
     def __init__(self, env: PolyEnv, files: BounceFileManager, logger: Logger) -> None:
         self.env: PolyEnv = env
         self.files: BounceFileManager = files
@@ -71,15 +101,23 @@ class TelegramUploader:
         self.session_file = self.paths.from_config(f"{env.phone}.session")
         self.client = TelegramClient(str(self.session_file), env.api_id, env.api_hash)  # type: ignore[reportArgumentType]
 
-    async def get_channel_entity(self) -> Channel | Chat:
+    async def get_channel_entity(self) -> ChannelEntity:
         """Get the Telegram channel entity for the given URL.
 
+        Tries the session cache first, which is a local lookup rather than a round trip to
+        Telegram, and only resolves the URL over the network if the channel isn't cached yet.
+
         Raises:
             ValueError: If the URL does not point to a channel or chat.
         """
         try:
-            entity = await self.client.get_entity(self.channel_url)
-            if not isinstance(entity, Channel | Chat):
+            try:
+                entity = await self.client.get_input_entity(self.channel_url)
+                valid_types = (InputPeerChannel, InputPeerChat)
+            except ValueError:
+                entity = await self.client.get_entity(self.channel_url)
+                valid_types = (Channel, Chat)
+            if not isinstance(entity, valid_types):
                 msg = "URL does not point to a channel or chat."
                 raise ValueError(msg)
             return entity
@@ -87,122 +125,194 @@ class TelegramUploader:
             self.logger.error("Could not find the channel for the URL: %s", self.channel_url)
             raise
 
-    async def post_file_to_channel(
-        self, file_path: Path, comment: str, channel_entity: Channel | Chat
-    ) -> None:
-        """Upload the given file to the given channel.
+    async def upload_file(self, file_path: Path, meta: FileMeta, position: int = 0) -> InputFile:
+        """Upload the contents of a file to Telegram without posting it anywhere yet.
 
         Args:
             file_path: The path to the file to upload.
-            comment: A comment to include with the file.
-            channel_entity: The channel entity to upload the file to.
-        """
-        file_path = Path(file_path)
-        filename = file_path.name
-        title = file_path.stem
-        duration = await self.files.get_audio_duration(str(file_path))
-        timestamp = await self.files.get_file_creation_time(str(file_path))
-
-        # Format duration as M:SS
-        minutes, seconds = divmod(duration, 60)
-        formatted_duration = f"{minutes}m{seconds:02d}s"
-        timestamp_text = f"{timestamp} • {formatted_duration}"
+            meta: The file's metadata, for its size and logging its timestamp.
+            position: Which line to draw this file's progress bar on, when uploading several.
 
+        Returns:
+            The uploaded file, ready to be sent to a channel.
+        """
         _copy_to_polyplayer(file_path, self.logger)
 
-        self.logger.info("Uploading '%s' created %s.", filename, timestamp)
-        self.logger.debug(
-            "Upload title: '%s'%s", title, f", with comment: {comment}" if comment else ""
-        )
-        self.logger.debug("Uploading to %s (channel ID: %s)", self.channel_url, channel_entity.id)
+        self.logger.info("Uploading '%s' created %s.", file_path.name, meta.timestamp)
 
         pbar = async_tqdm(
-            total=file_path.stat().st_size,
-            desc="Uploading",
+            total=meta.size,
+            desc=file_path.name,
             unit="B",
             unit_scale=True,
             unit_divisor=1024,
             leave=False,
+            position=position,
+            disable=None,  # Skip the bar entirely when not writing to a terminal
         )
 
-        def update_progress(sent: int, _: int) -> None:
-            pbar.update(sent - pbar.n)
+        last_update = 0.0
+
+        def update_progress(sent: int, total: int) -> None:
+            nonlocal last_update
+            now = time.monotonic()
+            if now - last_update >= self.PROGRESS_INTERVAL or sent >= total:
+                pbar.update(sent - pbar.n)
+                last_update = now
 
         try:
-            await self.client.send_file(
-                channel_entity,
-                str(file_path),
-                caption=f"{title}\n{timestamp_text}\n{comment}",
-                attributes=[DocumentAttributeAudio(duration=duration)],
-                progress_callback=update_progress,
-            )  # type: ignore[reportArgumentType]
+            return await self._upload_parts(file_path, meta.size, update_progress)
         except (KeyboardInterrupt, asyncio.CancelledError):
             pbar.reset()
+            raise
+        finally:
             pbar.close()
-            self.logger.error("Upload canceled.")
-            return
 
-        pbar.close()
+    @async_retry_on_exception(
+        (ConnectionError, TimeoutError), tries=UPLOAD_RETRY_TRIES, delay=UPLOAD_RETRY_DELAY
+    )
+    async def _upload_parts(
+        self, file_path: Path, file_size: int, progress_callback: Callable[[int, int], None]
+    ) -> InputFile:
+        """Upload a file in the largest parts Telegram allows, retrying if the connection drops."""
+        return await self.client.upload_file(
+            str(file_path),
+            part_size_kb=self.UPLOAD_PART_SIZE_KB,
+            file_size=file_size,
+            progress_callback=progress_callback,
+        )
+
+    @async_retry_on_exception(
+        (ConnectionError, TimeoutError), tries=UPLOAD_RETRY_TRIES, delay=UPLOAD_RETRY_DELAY
+    )
+    async def send_uploaded_file(
+        self,
+        file_path: Path,
+        uploaded_file: InputFile,
+        comment: str,
+        channel_entity: ChannelEntity,
+        meta: FileMeta,
+    ) -> None:
+        """Post an already uploaded file to the channel with its caption and duration."""
+        title = file_path.stem
+
+        # Format duration as M:SS
+        minutes, seconds = divmod(meta.duration, 60)
+        formatted_duration = f"{minutes}m{seconds:02d}s"
+        timestamp_text = f"{meta.timestamp} • {formatted_duration}"
+
+        self.logger.debug(
+            "Upload title: '%s'%s", title, f", with comment: {comment}" if comment else ""
+        )
+        self.logger.debug(
+            "Uploading to %s (channel ID: %s)", self.channel_url, get_peer_id(channel_entity)
+        )
+
+        await self.client.send_file(
+            channel_entity,
+            uploaded_file,
+            caption=f"{title}\n{timestamp_text}\n{comment}",
+            attributes=[DocumentAttributeAudio(duration=meta.duration)],
+        )  # type: ignore[reportArgumentType]
+
         self.logger.info("'%s' uploaded successfully.", file_path)
 
     async def upload_files(
-        self, files: list[Path], comment: str, channel_entity: Channel | Chat
-    ) -> None:
-        """Upload the given files to the channel."""
-        for file in files:
-            if Path(file).is_file():
-                await self.post_file_to_channel(file, comment, channel_entity)
-            else:
-                self.logger.warning("'%s' is not a valid file. Skipping.", file)
-
-    async def process_and_upload_file(
-        self, file: Path, comment: str, channel_entity: Channel | Chat
+        self,
+        files: list[Path],
+        comment: str,
+        channel_entity: ChannelEntity,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> None:
-        """Process a single file (convert if needed) and upload it to Telegram."""
-        if not Path(file).is_file():
-            self.logger.warning("'%s' is not a valid file. Skipping.", file)
-            return
-        try:
-            await self.post_file_to_channel(file, comment, channel_entity)
+        """Upload the given files to the channel, several at a time.
 
-        except Exception as e:
-            self.logger.error("Error processing '%s': %s", file, e)
-            self.logger.warning("Skipping '%s'.", file)
+        Files are expected to exist already, since they come from a glob, a checked path, or the
+        interactive picker, so they aren't stat'd again here. Up to `concurrency` files upload at
+        once, but each one is posted only after the files before it, so they still show up in the
+        channel in the order given.
+        """
+        # Each upload takes a free progress bar line and gives it back when done. That limits how
+        # many run at once and keeps two bars from ever drawing on the same line.
+        free_lines: asyncio.Queue[int] = asyncio.Queue()
+        for line in range(max(concurrency, 1)):
+            free_lines.put_nowait(line)
+
+        async def upload(file_path: Path) -> PreparedUpload:
+            line = await free_lines.get()
+            try:
+                meta = await self.files.get_metadata(str(file_path))
+                uploaded_file = await self.upload_file(file_path, meta, line)
+            finally:
+                free_lines.put_nowait(line)
+            return uploaded_file, meta
+
+        uploads = [asyncio.create_task(upload(Path(file))) for file in files]
+        try:
+            for file, task in zip(files, uploads, strict=True):
+                try:
+                    uploaded_file, meta = await task
+                    await self.send_uploaded_file(
+                        Path(file), uploaded_file, comment, channel_entity, meta
+                    )
+                except Exception as e:
+                    self.logger.error("Error processing '%s': %s", file, e)
+                    self.logger.warning("Skipping '%s'.", file)
+        finally:
+            for task in uploads:
+                task.cancel()
+
+
+def expand_file_patterns(patterns: list[str], logger: Logger) -> list[Path]:
+    """Expand paths and glob patterns into files, skipping duplicates but keeping their order."""
+    matched_files: dict[Path, None] = {}
+    for file_pattern in patterns:
+        if not file_pattern:
+            continue
+        pattern_path = Path(file_pattern)
+        if pattern_path.is_absolute():
+            if not pattern_path.is_file():
+                logger.warning("'%s' is not a valid file. Skipping.", file_pattern)
+                continue
+            matched_files.setdefault(pattern_path)
+        else:
+            # Patterns like * can match folders too, so only keep the files
+            matched_files.update(
+                dict.fromkeys(path for path in Path().glob(file_pattern) if path.is_file())
+            )
+    return list(matched_files)
 
 
-async def pybounce(env: PolyEnv, logger: Logger) -> None:
+async def pybounce(args: argparse.Namespace, env: PolyEnv, logger: Logger) -> None:
     """Upload files to a Telegram channel."""
-    args = parse_arguments()
     files = BounceFileManager(logger)
     telegram = TelegramUploader(env, files, logger)
-    sqlite = SQLiteManager(telegram.client)  # type: ignore
+    sqlite = SQLiteManager(telegram.client, telegram.session_file)  # type: ignore
 
     try:
         await sqlite.start_client()
         channel_entity = await telegram.get_channel_entity()
 
-        files_to_upload = []
-        if args.files:
-            for file_pattern in args.files:
-                if file_pattern:
-                    pattern_path = Path(file_pattern)
-                    if pattern_path.is_absolute():
-                        files_to_upload.append(pattern_path)
-                    else:
-                        files_to_upload.extend(Path().glob(file_pattern))
+        # Globbing touches the filesystem, so keep it off the event loop
+        matched_files = await asyncio.to_thread(expand_file_patterns, args.files or [], logger)
 
         # If no files were found or specified, fall back to interactive selection
-        files_to_upload = list(dict.fromkeys(files_to_upload)) or await files.select_interactively()
+        files_to_upload = matched_files or await files.select_interactively()
 
         if files_to_upload:
-            for file in files_to_upload:
-                await telegram.process_and_upload_file(Path(file), args.comment, channel_entity)
+            await telegram.upload_files(
+                [Path(file) for file in files_to_upload],
+                args.comment,
+                channel_entity,
+                concurrency=args.concurrency,
+            )
         else:
             logger.warning("No files selected for upload.")
 
     finally:
         await sqlite.disconnect_client()
-        files.thread_pool.shutdown()
+
+        # Save any newly probed durations once for the whole batch
+        await asyncio.to_thread(files.save_duration_cache)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -210,15 +320,26 @@ def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Upload audio files to a Telegram channel.")
     parser.add_argument("files", nargs="*", help="files to upload")
     parser.add_argument("comment", nargs="?", default="", help="comment to add to the upload")
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=TelegramUploader.DEFAULT_CONCURRENCY,
+        help="number of files to upload at once (default: %(default)s)",
+    )
 
     # Return default args if being run by pdoc
     if len(sys.argv) > 0 and sys.argv[0].endswith("pdoc"):
-        return argparse.Namespace(debug=False, files=[], comment="")
+        return argparse.Namespace(
+            debug=False, files=[], comment="", concurrency=TelegramUploader.DEFAULT_CONCURRENCY
+        )
     return parser.parse_args()
 
 
 def main() -> None:
     """Run the main function with asyncio."""
+    args = parse_arguments()
+
     env = PolyEnv()
     env.add_debug_var()
     env.add_var("PYBOUNCE_TELEGRAM_API_ID", attr_name="api_id", var_type=str)
@@ -228,7 +349,9 @@ def main() -> None:
 
     logger = PolyLog.get_logger(level=env.log_level)
 
-    async_with_handle_interrupt(pybounce, env, logger, message="Upload canceled.", logger=logger)
+    async_with_handle_interrupt(
+        pybounce, args, env, logger, message="Upload canceled.", logger=logger
+    )
 
 
 if __name__ == "__main__":
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import closing
 from typing import TYPE_CHECKING
 
 from polykit import PolyLog
 from polykit.core import async_retry_on_exception, polykit_setup
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from dsbin.pybounce.client_protocol import TelegramClientProtocol
 
 polykit_setup()
@@ -19,18 +22,39 @@ logger = PolyLog.get_logger(level="info")
 class SQLiteManager:
     """Manages the SQLite database for the Telegram client."""
 
-    # Retry configuration
-    RETRY_TRIES = 5
+    # Retry configuration. WAL mode means lock errors should be rare, so don't wait around long.
+    RETRY_TRIES = 2
     RETRY_DELAY = 5
 
-    def __init__(self, client: TelegramClientProtocol) -> None:
+    # How long SQLite waits on a locked database before giving up, in seconds
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(self, client: TelegramClientProtocol, session_file: Path | None = None) -> None:
         self.client = client
+        self.session_file = session_file
+
+    def enable_wal(self) -> None:
+        """Switch the session database to write-ahead logging.
+
+        In WAL mode, readers and a writer don't block each other, so overlapping runs (like Hazel
+        firing several at once) stop tripping over "database is locked". The journal mode is
+        stored in the database itself, so this sticks for Telethon's own connection too.
+        """
+        if self.session_file is None or not self.session_file.exists():
+            return  # Telethon creates the database on first start, so there's nothing to set yet
+
+        try:
+            with closing(sqlite3.connect(self.session_file, timeout=self.BUSY_TIMEOUT)) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            logger.debug("Could not enable WAL on the session database: %s", e)
 
     @async_retry_on_exception(
         sqlite3.OperationalError, tries=RETRY_TRIES, delay=RETRY_DELAY, logger=logger
     )
     async def start_client(self) -> None:
         """Start the client safely, retrying if a sqlite3.OperationalError occurs."""
+        self.enable_wal()
         await self.client.start()
 
     @async_retry_on_exception(
@@ -13,16 +13,37 @@ import argparse
 import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from polykit import PolyLog
 from polykit.cli import confirm_action
 from polykit.core import polykit_setup
 from polykit.text import color
 
+if TYPE_CHECKING:
+    from re import Match
+
 polykit_setup()
 
 logger = PolyLog.get_logger(simple=True, color=False)
 
+# Build date and time (e.g. 240331-1435), build number (e.g. 26100.1), and segment separators
+DATE_PATTERN = re.compile(r"(\d{6})-\d{4}")
+BUILD_PATTERN = re.compile(r"(\d+)\.(\d+)(?:\.(\d+))?")
+SEPARATOR_PATTERN = re.compile(r"[._-]")
+
+# Architecture and edition tags, all found in a single pass over the name
+TAG_PATTERN = re.compile(r"X64FRE|A(?:RM)?64FRE|CLIENT(?:PRO|ENTERPRISE|EDU|HOME)")
+
+# What each tag means, in priority order for names that have more than one
+ARCH_TAGS = {"X64FRE": "x64", "ARM64FRE": "ARM64", "A64FRE": "ARM64"}
+EDITION_TAGS = {
+    "CLIENTPRO": "Pro",
+    "CLIENTENTERPRISE": "Enterprise",
+    "CLIENTEDU": "Education",
+    "CLIENTHOME": "Home",
+}
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -41,36 +62,37 @@ def parse_arguments() -> argparse.Namespace:
 
 def destupify_filename(filename: str) -> str:
     """Turn a stupid Windows 11 ISO filename into a non-stupid one."""
-    if filename.upper().endswith(".ISO"):
+    if filename[-4:].upper() == ".ISO":
         filename = filename[:-4]
 
-    build_str = _decipher_build(filename)
-    date_str = _decipher_date(filename)
-    arch = _decipher_arch(filename)
-    edition = _decipher_edition(filename)
+    date_match = DATE_PATTERN.search(filename)
+    build_str = _decipher_build(filename, date_match)
+    date_str = _decipher_date(date_match)
+    tags = set(TAG_PATTERN.findall(filename.upper()))
+    arch = _decipher_arch(tags)
+    edition = _decipher_edition(tags)
 
     if date_str:  # Prioritize date for proper sorting
         return f"Win11_{edition}_{date_str}_{build_str}_{arch}"
     return f"Win11_{edition}_{build_str}_{arch}"
 
 
-def _decipher_build(filename: str) -> str:
-    # First extract the date pattern so we can exclude it
-    date_match = re.search(r"(\d{6})-\d{4}", filename)
+def _decipher_build(filename: str, date_match: Match[str] | None) -> str:
+    # Get the date part so we can exclude it
     date_part = date_match.group(0) if date_match else ""
 
     # Remove the date part from the string for version extraction
     clean_filename = filename.replace(date_part, "") if date_part else filename
 
     # Now extract the build info
-    build_match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", clean_filename)
+    build_match = BUILD_PATTERN.search(clean_filename)
 
     if build_match:
         major = build_match.group(1)
         minor = build_match.group(2)
         revision = build_match.group(3) or ""
     else:
-        segments = re.split(r"[._-]", clean_filename)
+        segments = SEPARATOR_PATTERN.split(clean_filename)
         if len(segments) >= 2:
             major = segments[0]
             minor = segments[1]
@@ -79,8 +101,7 @@ def _decipher_build(filename: str) -> str:
     return f"{major}.{minor}.{revision}" if revision else f"{major}.{minor}"
 
 
-def _decipher_date(filename: str) -> str:
-    date_match = re.search(r"(\d{6})-\d{4}", filename)
+def _decipher_date(date_match: Match[str] | None) -> str:
     if date_match:
         date_code = date_match.group(1)
         year = date_code[:2]
@@ -91,26 +112,12 @@ def _decipher_date(filename: str) -> str:
     return ""
 
 
-def _decipher_arch(filename: str) -> str:
-    architecture = "unknown"
-    if "X64FRE" in filename.upper():
-        return "x64"
-    if "ARM64FRE" in filename.upper() or "A64FRE" in filename.upper():
-        return "ARM64"
-    return architecture
+def _decipher_arch(tags: set[str]) -> str:
+    return next((arch for tag, arch in ARCH_TAGS.items() if tag in tags), "unknown")
 
 
-def _decipher_edition(filename: str) -> str:
-    edition = "Pro"
-    if "CLIENTPRO" in filename.upper():
-        return "Pro"
-    if "CLIENTENTERPRISE" in filename.upper():
-        return "Enterprise"
-    if "CLIENTEDU" in filename.upper():
-        return "Education"
-    if "CLIENTHOME" in filename.upper():
-        return "Home"
-    return edition
+def _decipher_edition(tags: set[str]) -> str:
+    return next((edition for tag, edition in EDITION_TAGS.items() if tag in tags), "Pro")
 
 
 def main() -> None:
@@ -126,7 +133,7 @@ def main() -> None:
 
     # Get the new name and add the .iso extension back if the original had it
     new_name = destupify_filename(original_name)
-    if original_name.upper().endswith(".ISO"):
+    if original_name[-4:].upper() == ".ISO":
         new_name = f"{new_name}.iso"
 
     print()
@@ -29,6 +29,7 @@ class SpacePurger:
         self.temp_dir: str | None = None
         self.total_bytes_written: int = 0
         self.start_free_space: int = 0
+        self._fill_buffer: bytes | None = None
 
     def create_temp_file(self, size_bytes: int, file_num: int) -> str:
         """Create a temporary file of specified size."""
@@ -38,13 +39,13 @@ class SpacePurger:
         file_path = Path(self.temp_dir) / f"temp_file_{file_num:04d}.dat"
 
         # Create file with random data to prevent compression
+        fill_buffer = memoryview(self.get_fill_buffer())
         with file_path.open("wb") as f:
             remaining = size_bytes
             bytes_written_this_file = 0
             while remaining > 0:
                 chunk_size = min(self.chunk_size_bytes, remaining)
-                # Use os.urandom for truly random data that won't compress well
-                f.write(os.urandom(chunk_size))
+                f.write(fill_buffer[:chunk_size])
                 remaining -= chunk_size
                 bytes_written_this_file += chunk_size
 
@@ -52,6 +53,17 @@ class SpacePurger:
         self.total_bytes_written += size_bytes
         return str(file_path)
 
+    def get_fill_buffer(self) -> bytes:
+        """Get a chunk of random data to fill files with, generating it only once.
+
+        Use os.urandom for truly random data that won't compress well. Repeating the same chunk
+        doesn't change that, since it's far larger than any compression window, and it saves
+        generating 100 MB of fresh random data for every chunk written.
+        """
+        if self._fill_buffer is None:
+            self._fill_buffer = os.urandom(self.chunk_size_bytes)
+        return self._fill_buffer
+
     def clear_screen_and_show_header(self, title: str) -> None:
         """Clear screen and show a clean header."""
         print("\033[2J\033[H", end="")  # Clear screen and move cursor to top
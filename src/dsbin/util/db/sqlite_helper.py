@@ -3,7 +3,7 @@ from __future__ import annotations
 import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from polykit import PolyLog
 
@@ -22,6 +22,9 @@ class SQLiteHelper:
     database: str | Path
     _connection: sqlite3.Connection | None = None
 
+    # How long to wait on a locked database before giving up, in milliseconds
+    BUSY_TIMEOUT_MS: ClassVar[int] = 5000
+
     def __post_init__(self):
         self.logger: Logger = PolyLog.get_logger()
 
@@ -29,9 +32,15 @@ class SQLiteHelper:
     def connection(self) -> sqlite3.Connection:
         """Lazy initialization of SQLite connection.
 
+        The connection is opened on first use and then reused for every later query, so the setup
+        cost (including the pragmas) is only paid once.
+
         Raises:
             DatabaseError: If the database connection fails.
         """
+        if self._connection is not None:
+            return self._connection
+
         try:
             self._connection = sqlite3.connect(
                 str(self.database),
@@ -39,6 +48,8 @@ class SQLiteHelper:
                 check_same_thread=False,
             )
             self._connection.row_factory = sqlite3.Row
+            self._connection.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+            self._connection.execute("PRAGMA journal_mode=WAL")
             return self._connection
 
         except sqlite3.Error as e:
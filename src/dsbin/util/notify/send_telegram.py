@@ -87,7 +87,7 @@ class TelegramSender:
             performer: Name of the performer (displayed under the title).
         """
         try:
-            with Path(audio_path).open(encoding="utf-8") as audio_file:
+            with Path(audio_path).open("rb") as audio_file:
                 payload = {
                     "chat_id": str(chat_id) or str(self.chat_id),
                     "duration": str(duration),
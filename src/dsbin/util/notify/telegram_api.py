@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import mimetypes
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import requests
 from polykit import PolyLog
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 if TYPE_CHECKING:
     from logging import Logger
 
+try:
+    from requests_toolbelt import MultipartEncoder
+
+    toolbelt_available = True
+except ImportError:
+    toolbelt_available = False
+
 
 class TelegramAPIHelper:
     """Helper class to interact with the Telegram API.
@@ -31,6 +42,13 @@ class TelegramAPIHelper:
         self.timeouts: dict[str, int] = {"sendPhoto": 30, "sendAudio": 60}
         self.default_timeout: int = 10
 
+        # Reuse one pooled connection to the API instead of reconnecting for every call
+        self.session: requests.Session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5)),
+        )
+
     def call_api(
         self,
         api_method: str,
@@ -44,6 +62,8 @@ class TelegramAPIHelper:
         commonly used method, or else the default timeout is used.
 
         If files are provided, it uses the `data` parameter to properly handle multipart/form-data.
+        When requests-toolbelt is installed, the multipart body is streamed from the open file
+        handles instead of being built in memory first, which matters for large audio files.
         Otherwise, it defaults to sending the payload as JSON. The payload is filtered to remove any
         None values before sending the request.
 
@@ -55,6 +75,7 @@ class TelegramAPIHelper:
                 used. Defaults to None.
             files: A dictionary for multipart encoding upload. Defaults to None.
                 Examples: `{"param_name": file-tuple}`, `{"param_name": file-like-object}`
+                File-like objects must be opened in binary mode.
 
         Returns:
             The response data in JSON if the request is successful.
@@ -67,11 +88,18 @@ class TelegramAPIHelper:
         timeout = timeout or self.timeouts.get(api_method, self.default_timeout)
 
         try:
-            response = (
-                requests.post(url, data=payload, files=files, timeout=timeout)
-                if files
-                else requests.post(url, json=payload, timeout=timeout)
-            )
+            if files and toolbelt_available:
+                encoder = self._multipart_encoder(payload, files)
+                response = self.session.post(
+                    url,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    timeout=timeout,
+                )
+            elif files:
+                response = self.session.post(url, data=payload, files=files, timeout=timeout)
+            else:
+                response = self.session.post(url, json=payload, timeout=timeout)
             response_data = response.json()
             if not response_data.get("ok"):
                 error_msg = response_data.get("description", "Unknown error.")
@@ -84,3 +112,16 @@ class TelegramAPIHelper:
             self.logger.warning("Request to Telegram API failed: %s", e)
             msg = f"Request to Telegram API failed: {e}"
             raise Exception(msg) from e
+
+    @staticmethod
+    def _multipart_encoder(payload: dict[str, str], files: dict[str, Any]) -> MultipartEncoder:
+        """Build a streaming multipart encoder from a payload and a requests-style files dict."""
+        fields: dict[str, Any] = dict(payload)
+        for name, file in files.items():
+            if isinstance(file, tuple):
+                fields[name] = file
+            else:
+                filename = Path(getattr(file, "name", name)).name
+                content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                fields[name] = (filename, file, content_type)
+        return MultipartEncoder(fields=fields)
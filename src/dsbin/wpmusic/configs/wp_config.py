@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import ClassVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
 
-import paramiko
 from polykit.env import PolyEnv
 from polykit.paths import PolyPath
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import paramiko
+
+
+@lru_cache(maxsize=4)
+def _load_private_key(path: str, passphrase: str) -> paramiko.Ed25519Key:
+    """Load and decrypt an SSH private key, once per key and passphrase for the whole process."""
+    import paramiko  # Only needed for uploads, so don't pay for the import otherwise
+
+    return paramiko.Ed25519Key.from_private_key_file(path, password=passphrase)
+
 
 @dataclass
 class WPConfig:
@@ -34,16 +48,17 @@ class WPConfig:
 
     # SSH settings
     ssh_passphrase: str = field(init=False)
-    _private_key: paramiko.Ed25519Key | None = field(default=None, init=False)
 
     # Supported file formats
-    formats: ClassVar[dict[str, str]] = {
-        "flac": ".flac",
-        "alac": ".m4a",
-        "mp3": ".mp3",
-    }
-    formats_to_convert: ClassVar[list[str]] = ["flac", "alac"]
-    formats_to_upload: ClassVar[list[str]] = ["flac", "alac"]
+    formats: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "flac": ".flac",
+            "alac": ".m4a",
+            "mp3": ".mp3",
+        }
+    )
+    formats_to_convert: ClassVar[tuple[str, ...]] = ("flac", "alac")
+    formats_to_upload: ClassVar[tuple[str, ...]] = ("flac", "alac")
 
     def __post_init__(self):
         # Initialize environment variables
@@ -106,8 +121,4 @@ class WPConfig:
     @property
     def private_key(self) -> paramiko.Ed25519Key:
         """Lazy load the SSH private key only when needed."""
-        if self._private_key is None:
-            self._private_key = paramiko.Ed25519Key.from_private_key_file(
-                self.private_key_path, password=self.ssh_passphrase
-            )
-        return self._private_key
+        return _load_private_key(str(self.private_key_path), self.ssh_passphrase)
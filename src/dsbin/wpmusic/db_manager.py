@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import operator
 import sqlite3
 import subprocess
 from contextlib import contextmanager
-from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -125,33 +126,67 @@ class DatabaseManager:
         """Record the current upload set to the database."""
         self._ensure_mysql_tunnel()
 
+        track_names = list(current_upload_set)
+        if not track_names:
+            return
+        name_placeholders = ", ".join(["%s"] * len(track_names))
+
         conn = self.mysql.pool.get_connection()
         try:
             cursor = conn.cursor()
-            for track_name, audio_tracks in current_upload_set.items():
-                cursor.execute("INSERT IGNORE INTO tracks (name) VALUES (%s)", (track_name,))
-                cursor.execute("SELECT id FROM tracks WHERE name = %s", (track_name,))
-                result = cursor.fetchone()
-                track_id = result[0]
 
+            # Make sure every track exists, then get all their IDs in one query
+            cursor.executemany(
+                "INSERT IGNORE INTO tracks (name) VALUES (%s)", [(name,) for name in track_names]
+            )
+            cursor.execute(
+                f"SELECT id, name FROM tracks WHERE name IN ({name_placeholders})",  # noqa: S608
+                track_names,
+            )
+            track_ids = {name: track_id for track_id, name in cursor.fetchall()}
+
+            # The table's collation ignores case and accents, so the stored name can differ from
+            # the one we have. Let MySQL do the matching for any name that comes back different.
+            for name in track_names:
+                if name not in track_ids:
+                    cursor.execute("SELECT id FROM tracks WHERE name = %s", (name,))
+                    track_ids[name] = cursor.fetchone()[0]
+
+            # Find which of these uploads are already recorded, all at once
+            id_placeholders = ", ".join(["%s"] * len(track_ids))
+            cursor.execute(
+                f"""
+                SELECT track_id, filename, instrumental FROM uploads
+                WHERE uploaded = %s AND track_id IN ({id_placeholders})
+                """,  # noqa: S608
+                (uploaded, *track_ids.values()),
+            )
+
+            # Compare filenames casefolded, since MySQL wouldn't consider case when matching them
+            existing = {
+                (track_id, filename.casefold(), bool(instrumental))
+                for track_id, filename, instrumental in cursor.fetchall()
+            }
+
+            new_uploads = []
+            for track_name, audio_tracks in current_upload_set.items():
+                track_id = track_ids[track_name]
                 for track in audio_tracks.values():
-                    cursor.execute(
-                        """
-                        SELECT COUNT(*) FROM uploads
-                        WHERE track_id = %s AND filename = %s AND instrumental = %s AND uploaded = %s
-                        """,
-                        (track_id, track.filename, track.is_instrumental, uploaded),
-                    )
-
-                    result = cursor.fetchone()
-                    if result and result[0] == 0:
-                        cursor.execute(
-                            """
-                            INSERT INTO uploads (track_id, filename, instrumental, uploaded)
-                            VALUES (%s, %s, %s, %s)
-                            """,
-                            (track_id, track.filename, track.is_instrumental, uploaded),
+                    key = (track_id, track.filename.casefold(), bool(track.is_instrumental))
+                    if key not in existing:
+                        existing.add(key)
+                        new_uploads.append(
+                            (track_id, track.filename, track.is_instrumental, uploaded)
                         )
+
+            if new_uploads:
+                cursor.executemany(
+                    """
+                    INSERT INTO uploads (track_id, filename, instrumental, uploaded)
+                    VALUES (%s, %s, %s, %s)
+                    """,
+                    new_uploads,
+                )
             conn.commit()
         finally:
             conn.close()
@@ -184,30 +219,23 @@ class DatabaseManager:
             query += " ORDER BY t.name, u.uploaded DESC"
             results = db.fetch_many(query)
 
-        # Process results into the required format
-        history = []
-        current_track = None
-
-        for row in results:
-            if current_track is None or current_track["track_name"] != row["track_name"]:
-                if current_track is not None:
-                    history.append(current_track)
-                current_track = {"track_name": row["track_name"], "uploads": []}
-
-            uploaded = row["uploaded"]
-            if isinstance(uploaded, datetime):
-                uploaded = uploaded.isoformat()
-
-            current_track["uploads"].append({
-                "filename": row["filename"],
-                "instrumental": row["instrumental"],
-                "uploaded": uploaded,
-            })
-
-        if current_track is not None:
-            history.append(current_track)
-
-        return history
+        # Rows arrive ordered by track, so group them as they come. MySQL hands back datetimes
+        # while the SQLite cache stores strings, so work out once whether they need converting.
+        from_mysql = isinstance(db, MySQLHelper)
+        return [
+            {
+                "track_name": track_name,
+                "uploads": [
+                    {
+                        "filename": row["filename"],
+                        "instrumental": row["instrumental"],
+                        "uploaded": row["uploaded"].isoformat() if from_mysql else row["uploaded"],
+                    }
+                    for row in rows
+                ],
+            }
+            for track_name, rows in groupby(results, key=operator.itemgetter("track_name"))
+        ]
 
     def refresh_cache(self) -> None:
         """Refresh the local SQLite cache from MySQL."""
@@ -230,6 +258,10 @@ class DatabaseManager:
                 FOREIGN KEY (track_id) REFERENCES tracks(id)
             )
         """)
+        self.sqlite.execute("""
+            CREATE INDEX IF NOT EXISTS idx_uploads_track_uploaded
+            ON uploads (track_id, uploaded DESC)
+        """)
 
         # Copy data
         tracks = self.mysql.fetch_many("SELECT * FROM tracks")
@@ -256,6 +288,7 @@ class DatabaseManager:
         """Force a refresh of the local cache from MySQL."""
         self.logger.debug("Forcing cache refresh from MySQL.")
         if Path(self.config.local_sqlite_db).exists():
+            self.sqlite.close()  # The open connection would keep writing to the deleted file
             Path(self.config.local_sqlite_db).unlink()
         self.refresh_cache()
 
@@ -264,6 +297,7 @@ class DatabaseManager:
         self.logger.debug("Forcing cache refresh from MySQL.")
         cache_path = Path(self.config.local_sqlite_db)
         if cache_path.exists():
+            self.sqlite.close()  # The open connection would keep writing to the deleted file
             cache_path.unlink()
         self.refresh_cache()
 
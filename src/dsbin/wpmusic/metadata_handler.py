@@ -1,6 +1,7 @@
 # ruff: noqa: PLC2701
 from __future__ import annotations
 
+import hashlib
 import json
 from io import BytesIO
 from typing import TYPE_CHECKING, Any
@@ -12,6 +13,8 @@ from mutagen.id3._frames import APIC, TALB, TCON, TDRC, TIT2, TPE1, TRCK  # type
 from mutagen.mp3 import MP3
 from mutagen.mp4 import MP4, MP4Cover
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 if TYPE_CHECKING:
     from logging import Logger
@@ -30,11 +33,18 @@ class MetadataHandler:
         self._full_metadata: dict[str, Any] | None = None
         self._cover_data: bytes | None = None
 
+        # Share one pooled session between the metadata and cover art requests
+        self.session: requests.Session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5)),
+        )
+
     def fetch_metadata(self) -> tuple[dict[str, Any], bytes | None]:
         """Retrieve metadata and cover art."""
         self.logger.debug("Fetching metadata from %s", self.config.metadata_url)
         try:
-            response = requests.get(self.config.metadata_url, timeout=10)
+            response = self.session.get(self.config.metadata_url, timeout=10)
 
             # Check if response is successful
             response.raise_for_status()
@@ -69,17 +79,28 @@ class MetadataHandler:
 
         return all_metadata, cover_data
 
-    @staticmethod
-    def download_cover_art(url: str) -> bytes | None:
-        """Download cover art from the given URL and return the bytes."""
-        response = requests.get(url, timeout=10)
-        cover_art_bytes = BytesIO(response.content)
-        cover_image = Image.open(cover_art_bytes).convert("RGB")
-        cover_data = cover_image.resize((800, 800))
+    def download_cover_art(self, url: str) -> bytes | None:
+        """Download cover art from the given URL and return the bytes.
+
+        The resized JPEG is cached on disk keyed by a hash of the original image, so the decode,
+        resize, and re-encode only happen when the cover art actually changes.
+        """
+        response = self.session.get(url, timeout=10)
+        digest = hashlib.sha256(response.content).hexdigest()
+        cache_path = self.config.paths.from_cache(f"cover_{digest}.jpg")
+
+        if cache_path.is_file():
+            self.logger.debug("Using cached cover art from %s", cache_path)
+            return cache_path.read_bytes()
+
+        cover_image = Image.open(BytesIO(response.content)).convert("RGB")
+        cover_data = cover_image.resize((800, 800), Image.Resampling.LANCZOS)
         buffered = BytesIO()
-        cover_data.save(buffered, format="JPEG")
+        cover_data.save(buffered, format="JPEG", quality=90, optimize=True)
 
-        return buffered.getvalue()
+        cover_bytes = buffered.getvalue()
+        cache_path.write_bytes(cover_bytes)
+        return cover_bytes
 
     def apply_metadata(self, audio_track: AudioTrack, audio_format: str, path: Path) -> Path:
         """Prepare the metadata for the file based on its format.
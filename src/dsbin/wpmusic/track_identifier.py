@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import inquirer
 from polykit.text import color as colored
 
 from dsbin.wpmusic.audio_track import AudioTrack
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from logging import Logger
 
     from halo import Halo
@@ -21,6 +22,11 @@ if TYPE_CHECKING:
 class TrackIdentifier:
     """Identify a track based on input file and metadata."""
 
+    VERSION_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r" [0-9]+\.[0-9]+\.[0-9]+([._][0-9]+)?[a-z]*"
+    )
+    SLUG_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[^a-zA-Z0-9-]")
+
     def __init__(self, config: WPConfig, metadata_handler: MetadataHandler, logger: Logger):
         self.config = config
         self.metadata_handler = metadata_handler
@@ -87,6 +93,20 @@ class TrackIdentifier:
                 msg = "No track selected. Aborting."
                 raise TypeError(msg) from e
 
+    @cached_property
+    def tracks_by_slug(self) -> dict[str, dict[str, Any]]:
+        """Map each track's normalized filename to the track, worked out once per metadata set."""
+        tracks_by_slug: dict[str, dict[str, Any]] = {}
+        for track in self.tracks:
+            slug = self._slugify(Path(track["file_url"]).stem)
+            tracks_by_slug.setdefault(slug, track)  # The first match wins, as it always has
+        return tracks_by_slug
+
+    @classmethod
+    def _slugify(cls, name: str) -> str:
+        """Normalize a filename for comparison: no apostrophes, dashes for the rest, lowercase."""
+        return cls.SLUG_PATTERN.sub("-", name.replace("'", "")).strip("-").lower()
+
     def _identify_by_name(self, audio_track: AudioTrack) -> dict[str, AudioTrack]:
         """Identify the track by matching its upload filename against URLs in metadata.
 
@@ -95,31 +115,17 @@ class TrackIdentifier:
         """
         self.logger.debug("Matching filename '%s' to track metadata...", audio_track.filename)
 
-        # Remove "No Vocals" and strip the filename for comparison
+        # Remove "No Vocals" and the version, then compare against the track filenames
         file_path = Path(audio_track.filename)
-        formatted_file_name = str(file_path.stem).replace(" No Vocals", "").replace("'", "")
-        formatted_file_name = re.sub(
-            r" [0-9]+\.[0-9]+\.[0-9]+([._][0-9]+)?[a-z]*", "", formatted_file_name
-        )
-        formatted_file_name = re.sub(r"[^a-zA-Z0-9-]", "-", formatted_file_name).strip("-").lower()
+        formatted_file_name = str(file_path.stem).replace(" No Vocals", "")
+        formatted_file_name = self._slugify(self.VERSION_PATTERN.sub("", formatted_file_name))
 
-        # Iterate through the tracks in the metadata and match the filename
-        for track in self.tracks:
-            json_filename = (
-                re.sub(
-                    r"[^a-zA-Z0-9-]",
-                    "-",
-                    Path(track["file_url"].replace("'", "")).stem,
-                )
-                .strip("-")
-                .lower()
+        self.logger.debug("Looking up '%s' in track metadata.", formatted_file_name)
+        if track := self.tracks_by_slug.get(formatted_file_name):
+            self.logger.debug(
+                "Processing and uploading %s: %s", audio_track.filename, track["track_name"]
             )
-            self.logger.debug("Comparing '%s' with '%s'", formatted_file_name, json_filename)
-            if formatted_file_name == json_filename:
-                self.logger.debug(
-                    "Processing and uploading %s: %s", audio_track.filename, track["track_name"]
-                )
-                return track
+            return track
 
         msg = "No track found in metadata."
         raise ValueError(msg)
@@ -132,28 +138,34 @@ class TrackIdentifier:
         """
         self.logger.debug("No track found for filename '%s'.", audio_track.filename)
 
-        selected_track_name = self._get_fallback_selection(self.tracks)
+        selected_track_name = self._get_fallback_selection(self.tracks_by_name)
 
         if selected_track_name == "(skip adding metadata)":
             return self._handle_skipped_metadata(audio_track)
 
-        for track in self.tracks:
-            if track["track_name"] == selected_track_name:
-                return track
+        if track := self.tracks_by_name.get(selected_track_name):
+            return track
 
         msg = "No track selected."
         raise ValueError(msg)
 
-    def _get_fallback_selection(self, tracks: list[dict[str, Any]]) -> str:
+    @cached_property
+    def tracks_by_name(self) -> dict[str, dict[str, Any]]:
+        """Map each track name to its track, for looking up a selection from the fallback menu."""
+        tracks_by_name: dict[str, dict[str, Any]] = {}
+        for track in self.tracks:
+            tracks_by_name.setdefault(f"{track['track_name']}", track)
+        return tracks_by_name
+
+    def _get_fallback_selection(self, track_names: Iterable[str]) -> str:
         """Generate a fallback menu for selecting a track.
 
         Raises:
             TypeError: If no track is selected from the fallback menu.
         """
-        choices = [
-            *sorted([f"{track['track_name']}" for track in tracks]),
-            "(skip adding metadata)",
-        ]
+        import inquirer  # Only needed when matching fails, so don't pay for the import otherwise
+
+        choices = [*sorted(track_names), "(skip adding metadata)"]
         questions = [
             inquirer.List(
                 "track",
@@ -176,6 +188,8 @@ class TrackIdentifier:
         Raises:
             TypeError: If no filename is confirmed.
         """
+        import inquirer  # Only needed when matching fails, so don't pay for the import otherwise
+
         filename_question = [
             inquirer.Text(
                 "confirmed_filename",
@@ -3,11 +3,13 @@ from __future__ import annotations
 import operator
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from polykit import TZ
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 from rich.text import Text
 
@@ -19,6 +21,15 @@ if TYPE_CHECKING:
 
 console = Console()
 
+# Shown in the instrumental column for tracks uploaded with an instrumental
+INST_MARK = "[bold]✓[/bold]"
+
+
+@lru_cache(maxsize=4096)
+def format_upload_time(uploaded: str) -> str:
+    """Format an ISO upload timestamp for display, reusing the result for repeated timestamps."""
+    return datetime.fromisoformat(uploaded).strftime("%a %m.%d.%Y %I:%M %p")
+
 
 class UploadTracker:
     """Track, log, and print file uploads."""
@@ -31,6 +42,9 @@ class UploadTracker:
         # Track the current set of uploads before recording them to the upload log
         self.current_upload_set: defaultdict[str, Any] = defaultdict(dict)
 
+        # Upload history by track name (None for all tracks), cleared whenever uploads are logged
+        self._history_cache: dict[str | None, list[dict[str, Any]]] = {}
+
     def log_upload_set(self) -> None:
         """Log the current set of uploads and clear the set."""
         if not self.current_upload_set:
@@ -41,13 +55,20 @@ class UploadTracker:
 
         self.db.record_upload_set_to_db(uploaded, self.current_upload_set)
         self.current_upload_set.clear()
+        self._history_cache.clear()
+
+    def get_upload_history(self, track_name: str | None = None) -> list[dict[str, Any]]:
+        """Get the upload history, only going to the database once per track between uploads."""
+        if track_name not in self._history_cache:
+            self._history_cache[track_name] = self.db.get_upload_history(track_name)
+        return self._history_cache[track_name]
 
     def pretty_print_history(
         self, track_name: str | None = None, uploads_per_song: int | None = None
     ) -> None:
         """Print the upload history in a beautifully formatted display."""
-        history = self.db.get_upload_history(track_name)
-        uploads_to_show = uploads_per_song or TableConfig().uploads_per_song
+        history = self.get_upload_history(track_name)
+        uploads_to_show = uploads_per_song or self.table_config.uploads_per_song
         num_uploads = uploads_to_show if not track_name else None
 
         # Create header with fixed width
@@ -66,23 +87,27 @@ class UploadTracker:
             table = Table(border_style="dim", padding=(0, 1), box=box.HORIZONTALS)
 
             table.add_column(
-                f"[yellow]{entry['track_name']}[/yellow]", style="cyan", width=36, no_wrap=True
+                f"[yellow]{escape(entry['track_name'])}[/yellow]",
+                style="cyan",
+                width=36,
+                no_wrap=True,
+                overflow="ellipsis",
             )
             table.add_column("[yellow]Inst[/yellow]", justify="center", style="green", width=4)
             table.add_column("[yellow]Uploaded[/yellow]", style="white", width=24)
 
             # Process uploads to pair instrumentals with their main tracks
-            processed_uploads = self._prepare_rows_for_display(entry["uploads"])
+            # History comes back from the database already ordered newest first
+            processed_uploads = self._prepare_rows_for_display(entry["uploads"], presorted=True)
             display_uploads = processed_uploads[:num_uploads] if num_uploads else processed_uploads
 
             for upload, has_inst in display_uploads:
-                filename = Text(upload["filename"], overflow="ellipsis")
-                date = datetime.fromisoformat(upload["uploaded"])
-                formatted_date = date.strftime("%a %m.%d.%Y %I:%M %p")
-
                 # Show ✓ for tracks that have instrumentals
-                inst_text = "[bold]✓[/bold]" if has_inst else ""
-                table.add_row(filename, inst_text, formatted_date)
+                table.add_row(
+                    escape(upload["filename"]),  # Names like "Song [remix]" aren't markup
+                    INST_MARK if has_inst else "",
+                    format_upload_time(upload["uploaded"]),
+                )
 
             if num_uploads and len(processed_uploads) > num_uploads:
                 more_count = len(processed_uploads) - num_uploads
@@ -92,43 +117,61 @@ class UploadTracker:
             console.print(table)
 
     def _prepare_rows_for_display(
-        self, data: list[dict[str, Any]]
+        self, data: list[dict[str, Any]], presorted: bool = False
     ) -> list[tuple[dict[str, Any], bool]]:
-        """Process rows to combine main tracks with their instrumentals and skip duplicates."""
-        # First pass: Handle instrumental pairing
-        paired_rows = []
-        prev_item = None
+        """Process rows to combine main tracks with their instrumentals and skip duplicates.
 
-        sorted_data = sorted(data, key=operator.itemgetter("uploaded"), reverse=True)
-
-        for item in sorted_data:
-            has_matching_inst = False
+        Pairing and deduplication happen in the same pass: each row is checked against the last
+        one kept as it's emitted, rather than in a second loop afterward.
 
-            # For non-instrumental tracks, check if the previous item was its instrumental
-            if not item["instrumental"] and prev_item is not None:
-                current_version = self._get_version(item["filename"])
-                prev_version = self._get_version(prev_item["filename"])
-
-                if prev_item["instrumental"] and current_version == prev_version:
-                    has_matching_inst = True
-                    paired_rows.pop()  # Remove the instrumental entry
-
-            paired_rows.append((item, has_matching_inst))
-            prev_item = item
-
-        # Second pass: Remove duplicates
-        final_rows = []
+        Args:
+            data: The uploads for a single track.
+            presorted: Whether the uploads are already ordered newest first, so they don't need
+                to be sorted again.
+        """
+        final_rows: list[tuple[dict[str, Any], bool]] = []
         prev_filename = None
 
-        for item, has_inst in paired_rows:
-            if item["filename"] != prev_filename:
+        def emit(item: dict[str, Any], has_inst: bool) -> None:
+            nonlocal prev_filename
+            if item["filename"] != prev_filename:  # Skip consecutive duplicates
                 final_rows.append((item, has_inst))
                 prev_filename = item["filename"]
 
+        pending_inst, pending_version = None, None
+        sorted_data = (
+            data if presorted else sorted(data, key=operator.itemgetter("uploaded"), reverse=True)
+        )
+
+        for item in sorted_data:
+            current_version = self._get_version(item["filename"])
+
+            # Hold each instrumental back until we know whether the next track is its main track
+            if item["instrumental"]:
+                if pending_inst is not None:
+                    emit(pending_inst, False)
+                pending_inst, pending_version = item, current_version
+                continue
+
+            if pending_inst is not None and current_version == pending_version:
+                emit(item, True)  # The instrumental is folded into this row
+            else:
+                if pending_inst is not None:
+                    emit(pending_inst, False)
+                emit(item, False)
+            pending_inst, pending_version = None, None
+
+        if pending_inst is not None:
+            emit(pending_inst, False)
+
         return final_rows
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _get_version(filename: str) -> str:
-        """Remove suffix and extract version number from filename."""
+        """Remove suffix and extract version number from filename.
+
+        The same filenames come up on every history view, so results are cached.
+        """
         base = filename.rsplit(".", 1)[0].replace(" No Vocals", "")
         return base.split()[-1]
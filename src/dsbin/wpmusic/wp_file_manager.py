@@ -4,7 +4,6 @@ import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import inquirer
 import paramiko  # type: ignore
 import pyperclip
 from polykit import PolyFile
@@ -61,6 +60,8 @@ class WPFileManager:
     @handle_interrupt()
     def prompt_for_custom_filename(self, default_filename: str) -> str | None:
         """Prompt the user to enter a custom filename."""
+        import inquirer  # Only needed for prompts, so don't pay for the import otherwise
+
         questions = [
             inquirer.Text(
                 "filename",